@@ -15,7 +15,7 @@ from pydantic import BaseModel
 
 from buildwise.core.concrete import ConcreteCalculator
 from buildwise.core.lumber import LumberCalculator, LumberType, LumberGrade
-from buildwise.core.steel import SteelCalculator, SteelType, SteelGrade
+from buildwise.core.steel import SteelCalculator, format_weight_result
 from buildwise.config.settings import settings
 from buildwise.storage.project import ProjectStorage, ProjectMaterial
 
@@ -187,7 +187,7 @@ async def calculate_steel(data: SteelRequest):
         
     # Perform calculation
     weight = steel_calculator.calculate_weight(
-        steel_type=SteelType(data.steel_type),
+        steel_type=data.steel_type,
         dimensions=data.dimensions,
         length=data.length,
         quantity=data.quantity,
@@ -198,13 +198,13 @@ async def calculate_steel(data: SteelRequest):
     if data.grade:
         cost = steel_calculator.calculate_cost(
             weight=weight,
-            steel_type=SteelType(data.steel_type),
-            grade=SteelGrade(data.grade),
+            steel_type=weight["steel_type"],
+            grade=data.grade,
             price_per_pound=data.price_per_pound
         )
     
     return {
-        "weight": weight,
+        "weight": format_weight_result(weight),
         "cost": cost
     }
 
@@ -237,7 +237,7 @@ async def get_project(name: str):
     project = project_storage.load_project(name)
     if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+    return project.to_dict()
 
 @app.delete("/api/v1/projects/{name}")
 async def delete_project(name: str):
@@ -259,10 +259,6 @@ class MaterialCreate(BaseModel):
 @app.post("/api/v1/projects/{name}/materials")
 async def add_material(name: str, data: MaterialCreate):
     """Add a material to a project."""
-    project = project_storage.load_project(name)
-    if project is None:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
     material = ProjectMaterial(
         material_type=data.material_type,
         name=data.name,
@@ -273,8 +269,9 @@ async def add_material(name: str, data: MaterialCreate):
         notes=data.notes
     )
     
-    project.add_material(material)
-    project_storage.save_project(project)
+    # Appends one line instead of rewriting the whole project file
+    if not project_storage.append_material(name, material):
+        raise HTTPException(status_code=404, detail="Project not found")
     
     return {"added": True}
 
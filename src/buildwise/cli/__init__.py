@@ -5,7 +5,7 @@ from typing import Optional
 
 from buildwise.core.concrete import ConcreteCalculator
 from buildwise.core.lumber import LumberCalculator, LumberType, LumberGrade
-from buildwise.core.steel import SteelCalculator, SteelType, SteelGrade
+from buildwise.core.steel import SteelCalculator, SteelType, SteelGrade, format_weight_result
 
 app = typer.Typer(
     help="BuildWise CLI: A comprehensive construction calculator suite",
@@ -173,6 +173,8 @@ def steel(
             price_per_pound=price_per_pound
         )
     
+    display = format_weight_result(result)
+    
     table = Table(title="Steel Calculation Results")
     table.add_column("Measurement")
     table.add_column("Value")
@@ -186,8 +188,8 @@ def steel(
         table.add_row("Diameter", f"{diameter}\"")
     table.add_row("Length", f"{length} {length_unit}")
     table.add_row("Quantity", str(quantity))
-    table.add_row("Weight Per Foot", f"{result['weight_per_foot']} lb/ft")
-    table.add_row("Total Weight", f"{result['weight']} {result['weight_unit']}")
+    table.add_row("Weight Per Foot", f"{display['weight_per_foot']} lb/ft")
+    table.add_row("Total Weight", f"{display['weight']} {display['weight_unit']}")
     if cost:
         table.add_row("Cost", f"${cost:.2f}")
     
@@ -207,8 +209,8 @@ def steel(
                 writer.writerow(["Diameter", f"{diameter}\""])
             writer.writerow(["Length", f"{length} {length_unit}"])
             writer.writerow(["Quantity", quantity])
-            writer.writerow(["Weight Per Foot", f"{result['weight_per_foot']} lb/ft"])
-            writer.writerow(["Total Weight", f"{result['weight']} {result['weight_unit']}"])
+            writer.writerow(["Weight Per Foot", f"{display['weight_per_foot']} lb/ft"])
+            writer.writerow(["Total Weight", f"{display['weight']} {display['weight_unit']}"])
             if cost:
                 writer.writerow(["Cost", f"${cost:.2f}"])
         console.print(f"Results saved to {output}")
@@ -325,8 +327,8 @@ def project(
     
     # Add material to project
     if add_material:
-        project = storage.load_project(add_material)
-        if not project:
+        # Check up front so the user is not prompted for a missing project
+        if not storage.project_exists(add_material):
             console.print(f"[red]Project not found: {add_material}[/red]")
             return
         
@@ -346,10 +348,11 @@ def project(
             notes=notes
         )
         
-        project.add_material(material)
-        storage.save_project(project)
+        if not storage.append_material(add_material, material):
+            console.print(f"[red]Project not found: {add_material}[/red]")
+            return
         
-        console.print(f"[green]Added material to project: {project.name}[/green]")
+        console.print(f"[green]Added material to project: {add_material}[/green]")
         return
     
     # Export project to CSV
@@ -561,7 +564,7 @@ def lumber_project(
     table.add_row("Total Board Feet", str(result["total_board_feet"]))
     table.add_row("Waste Factor", f"{waste_factor * 100:.0f}%")
     table.add_row("Total with Waste", str(result["total_with_waste"]))
-    table.add_row("Total Cost", f"${result['total_cost']:.2f}")
+    table.add_row("Total Cost", f"${result['cost']:.2f}")
     
     console.print(table)
     
@@ -591,7 +594,7 @@ def lumber_project(
             writer.writerow(["Total Board Feet", result["total_board_feet"]])
             writer.writerow(["Waste Factor", f"{waste_factor * 100:.0f}%"])
             writer.writerow(["Total with Waste", result["total_with_waste"]])
-            writer.writerow(["Total Cost", f"${result['total_cost']:.2f}"])
+            writer.writerow(["Total Cost", f"${result['cost']:.2f}"])
             writer.writerow([])
             
             writer.writerow(["Pieces"])
@@ -28,6 +28,9 @@ class Settings:
         # Current settings
         self._settings = {}
         
+        # Bumped whenever material prices change, so consumers can drop snapshots
+        self._prices_version = 0
+        
         # Load settings
         self._ensure_config_dir()
         self._load_settings()
@@ -109,12 +112,18 @@ class Settings:
         """Get material prices."""
         return self._settings.get("material_prices", self._defaults["material_prices"])
     
+    @property
+    def prices_version(self) -> int:
+        """Get a counter that changes whenever material prices are updated."""
+        return self._prices_version
+    
     def update_material_price(self, key: str, value: float):
         """Update material price."""
         if "material_prices" not in self._settings:
             self._settings["material_prices"] = {}
         
         self._settings["material_prices"][key] = value
+        self._prices_version += 1
         self._save_settings()
     
     def to_dict(self) -> Dict[str, Any]:
@@ -3,10 +3,27 @@
 from decimal import Decimal
 from typing import Dict, Union
 
-from pint import UnitRegistry
+# Unit registry shared by all calculators, so Pint's definition parsing and
+# conversion caches are paid for once per process. Pint is imported on first
+# use, keeping it off the startup path of commands that never need it.
+_ureg = None
 
-# Initialize unit registry with default definitions
-ureg = UnitRegistry()
+
+def _get_unit_registry():
+    """Return the shared unit registry, creating it on first use."""
+    global _ureg
+    if _ureg is None:
+        from pint import UnitRegistry
+
+        _ureg = UnitRegistry()
+    return _ureg
+
+
+def __getattr__(name: str):
+    # Keep the module-level ``ureg`` name available without eager creation
+    if name == "ureg":
+        return _get_unit_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ConcreteCalculator:
@@ -14,7 +31,7 @@ class ConcreteCalculator:
 
     def __init__(self):
         """Initialize the concrete calculator."""
-        self.ureg = UnitRegistry()
+        self.ureg = _get_unit_registry()
         self.Q_ = self.ureg.Quantity
 
     def calculate_volume(
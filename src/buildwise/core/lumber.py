@@ -1,5 +1,6 @@
+from decimal import Decimal
 from enum import Enum
-import math
+from types import MappingProxyType
 
 class LumberType(str, Enum):
     PINE = "pine"
@@ -25,79 +26,96 @@ class LumberGrade(str, Enum):
     STUD = "stud"
     CUSTOM = "custom"
 
+_LUMBER_TYPES = {lumber_type.value: lumber_type for lumber_type in LumberType}
+_LUMBER_GRADES = {grade.value: grade for grade in LumberGrade}
+
+def _coerce(lumber_type, grade):
+    """Normalize lumber type and grade strings to their enum members.
+    
+    Unknown values are returned unchanged so price lookups fall back to
+    the default price.
+    """
+    if not isinstance(lumber_type, LumberType):
+        lumber_type = _LUMBER_TYPES.get(str(lumber_type).lower(), lumber_type)
+    if not isinstance(grade, LumberGrade):
+        grade = _LUMBER_GRADES.get(str(grade).lower(), grade)
+    return lumber_type, grade
+
+def _to_decimal(value):
+    """Convert a numeric value to Decimal without binary float artifacts."""
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+def _round_cents(amount):
+    """Round a dollar amount to whole cents, halves away from zero."""
+    cents = int(abs(amount) * 100 + 0.5)
+    return (cents if amount >= 0 else -cents) / 100.0
+
+# Nominal to actual dimension mapping (inches), shared by thickness and width
+_NOMINAL_TO_ACTUAL = MappingProxyType({
+    2: 1.5,
+    3: 2.5,
+    4: 3.5,
+    6: 5.5,
+    8: 7.25,
+    10: 9.25,
+    12: 11.25
+})
+
+_DIMENSION_MAP = MappingProxyType({
+    "thickness": _NOMINAL_TO_ACTUAL,
+    "width": _NOMINAL_TO_ACTUAL
+})
+
+# Default pine prices per board foot by grade
+_PINE_PRICES = {
+    LumberGrade.SELECT: 6.0,
+    LumberGrade.ONE: 4.5,
+    LumberGrade.TWO: 3.0,
+    LumberGrade.THREE: 2.5,
+    LumberGrade.CONSTRUCTION: 3.2,
+    LumberGrade.STANDARD: 2.8,
+    LumberGrade.UTILITY: 2.3,
+    LumberGrade.ECONOMY: 2.0,
+    LumberGrade.STUD: 2.6,
+    LumberGrade.CUSTOM: 5.0
+}
+
+# Multipliers for different lumber types relative to pine
+_PRICE_MULTIPLIERS = {
+    LumberType.FIR: 1.2,
+    LumberType.CEDAR: 1.5,
+    LumberType.OAK: 2.5,
+    LumberType.MAPLE: 2.8,
+    LumberType.WALNUT: 3.5,
+    LumberType.REDWOOD: 2.0,
+    LumberType.SPRUCE: 1.1,
+    LumberType.CYPRESS: 1.8,
+    LumberType.POPLAR: 1.3
+}
+
+def _build_price_table():
+    """Build the default price table for every lumber type and grade."""
+    table = {}
+    for lumber_type in LumberType:
+        multiplier = _PRICE_MULTIPLIERS.get(lumber_type)
+        prices = _PINE_PRICES.copy()
+        if multiplier is not None:
+            for grade in prices:
+                prices[grade] *= multiplier
+        table[lumber_type] = MappingProxyType(prices)
+    return MappingProxyType(table)
+
+_PRICE_TABLE = _build_price_table()
+
 class LumberCalculator:
     """Calculator for lumber measurements and cost estimation."""
     
     def __init__(self):
-        # Nominal to actual dimension mappings
-        self.dimension_map = {
-            # thickness (nominal -> actual)
-            "thickness": {
-                2: 1.5,
-                3: 2.5,
-                4: 3.5,
-                6: 5.5,
-                8: 7.25,
-                10: 9.25,
-                12: 11.25
-            },
-            # width (nominal -> actual)
-            "width": {
-                2: 1.5,
-                3: 2.5,
-                4: 3.5,
-                6: 5.5,
-                8: 7.25,
-                10: 9.25,
-                12: 11.25
-            }
-        }
-        
-        # Default prices per board foot by lumber type and grade
-        self.price_table = {
-            LumberType.PINE: {
-                LumberGrade.SELECT: 6.0,
-                LumberGrade.ONE: 4.5,
-                LumberGrade.TWO: 3.0,
-                LumberGrade.THREE: 2.5,
-                LumberGrade.CONSTRUCTION: 3.2,
-                LumberGrade.STANDARD: 2.8,
-                LumberGrade.UTILITY: 2.3,
-                LumberGrade.ECONOMY: 2.0,
-                LumberGrade.STUD: 2.6,
-                LumberGrade.CUSTOM: 5.0
-            },
-            # Add more lumber types as needed...
-        }
-        
-        # Set default prices for other lumber types
-        for lumber_type in LumberType:
-            if lumber_type not in self.price_table:
-                self.price_table[lumber_type] = self.price_table[LumberType.PINE].copy()
-        
-        # Adjust prices for other lumber types
-        self._adjust_prices()
-    
-    def _adjust_prices(self):
-        """Adjust prices for different lumber types."""
-        # Multipliers for different lumber types relative to pine
-        multipliers = {
-            LumberType.FIR: 1.2,
-            LumberType.CEDAR: 1.5,
-            LumberType.OAK: 2.5,
-            LumberType.MAPLE: 2.8,
-            LumberType.WALNUT: 3.5,
-            LumberType.REDWOOD: 2.0,
-            LumberType.SPRUCE: 1.1,
-            LumberType.CYPRESS: 1.8,
-            LumberType.POPLAR: 1.3
-        }
-        
-        # Apply multipliers
-        for lumber_type, multiplier in multipliers.items():
-            if lumber_type in self.price_table:
-                for grade in self.price_table[lumber_type]:
-                    self.price_table[lumber_type][grade] *= multiplier
+        # Shared, read-only lookup tables built once at import
+        self.dimension_map = _DIMENSION_MAP
+        self.price_table = _PRICE_TABLE
     
     def calculate_board_feet(self, nominal_width, nominal_thickness, length, quantity=1, length_unit="feet"):
         """Calculate board feet for given lumber dimensions.
@@ -112,14 +130,14 @@ class LumberCalculator:
         Returns:
             dict: Board feet calculation results
         """
-        # Convert length to feet if necessary
-        length_feet = length
+        # Coerce once at entry (e.g. from Decimal) so the math below is all float
+        length_feet = float(length)
         if length_unit == "meters":
-            length_feet = length * 3.28084
+            length_feet = length_feet * 3.28084
         
-        # Get actual dimensions
-        actual_thickness = self.dimension_map["thickness"].get(nominal_thickness, nominal_thickness)
-        actual_width = self.dimension_map["width"].get(nominal_width, nominal_width)
+        # Get actual dimensions (unlisted sizes are used as-is)
+        actual_thickness = float(_NOMINAL_TO_ACTUAL.get(nominal_thickness, nominal_thickness))
+        actual_width = float(_NOMINAL_TO_ACTUAL.get(nominal_width, nominal_width))
         
         # Calculate board feet: (thickness * width * length) / 12
         board_feet = (actual_thickness * actual_width * length_feet * quantity) / 12
@@ -136,6 +154,44 @@ class LumberCalculator:
             }
         }
     
+    def calculate_board_feet_decimal(self, nominal_width, nominal_thickness, length, quantity=1, length_unit="feet"):
+        """Calculate board feet using exact Decimal arithmetic.
+        
+        Same as calculate_board_feet, but inputs are converted to Decimal and
+        all results are Decimal, for bid and invoicing contexts where float
+        rounding is not acceptable.
+        
+        Args:
+            nominal_width: Nominal width in inches (e.g., 4 for a 2x4)
+            nominal_thickness: Nominal thickness in inches (e.g., 2 for a 2x4)
+            length: Length of the lumber
+            quantity: Number of pieces
+            length_unit: Unit for length (feet or meters)
+            
+        Returns:
+            dict: Board feet calculation results
+        """
+        length_feet = _to_decimal(length)
+        if length_unit == "meters":
+            length_feet *= Decimal("3.28084")
+        
+        actual_thickness = _to_decimal(_NOMINAL_TO_ACTUAL.get(nominal_thickness, nominal_thickness))
+        actual_width = _to_decimal(_NOMINAL_TO_ACTUAL.get(nominal_width, nominal_width))
+        
+        cross_section = actual_thickness * actual_width * length_feet * quantity
+        
+        return {
+            "board_feet": cross_section / 12,
+            "actual_thickness": actual_thickness,
+            "actual_width": actual_width,
+            "length_feet": length_feet,
+            "quantity": quantity,
+            "volume": {
+                "cubic_inches": cross_section * 12,
+                "cubic_feet": cross_section / 144
+            }
+        }
+    
     def calculate_cost(self, board_feet, lumber_type=LumberType.PINE, grade=LumberGrade.TWO, price_per_board_foot=None):
         """Calculate cost based on board feet.
         
@@ -157,7 +213,8 @@ class LumberCalculator:
         price = price_per_board_foot
         if price is None:
             # Use default price from table
-            price = self.price_table.get(lumber_type, {}).get(grade, 3.0)
+            lumber_type, grade = _coerce(lumber_type, grade)
+            price = self.get_default_price(lumber_type, grade)
         
         # Calculate cost
         cost = bf * price
@@ -175,30 +232,34 @@ class LumberCalculator:
         Returns:
             dict: Project calculation results
         """
+        lumber_type, grade = _coerce(lumber_type, grade)
         total_board_feet = 0
         pieces = []
+        append = pieces.append
+        actual = _NOMINAL_TO_ACTUAL.get
         
-        for dimension in dimensions:
-            width, thickness, length, quantity = dimension
-            result = self.calculate_board_feet(width, thickness, length, quantity)
-            total_board_feet += result["board_feet"]
-            pieces.append({
+        # Same arithmetic as calculate_board_feet, inlined so each piece
+        # skips the call and its unused volume dict
+        for width, thickness, length, quantity in dimensions:
+            board_feet = (float(actual(thickness, thickness)) * float(actual(width, width)) * float(length) * quantity) / 12
+            total_board_feet += board_feet
+            append({
                 "dimensions": f"{thickness}x{width}x{length}'",
                 "quantity": quantity,
-                "board_feet": result["board_feet"]
+                "board_feet": board_feet
             })
         
         # Apply waste factor
         total_with_waste = total_board_feet * (1 + waste_factor)
         
-        # Calculate cost
+        # Calculate cost, rounding to cents only at the boundary
         cost = self.calculate_cost(total_with_waste, lumber_type, grade)
         
         return {
             "total_board_feet": total_board_feet,
             "waste_factor": waste_factor,
             "total_with_waste": total_with_waste,
-            "cost": cost,
+            "cost": _round_cents(cost),
             "pieces": pieces
         }
     
@@ -227,4 +288,7 @@ class LumberCalculator:
     def get_default_price(self, lumber_type, grade):
         """Get default price for lumber type and grade."""
         # This would normally call an API, but we'll simulate it for now
-        return self.price_table.get(lumber_type, {}).get(grade, 3.0)
+        try:
+            return self.price_table[lumber_type][grade]
+        except KeyError:
+            return 3.0
@@ -1,4 +1,7 @@
+from dataclasses import dataclass
 from enum import Enum
+from math import pi
+from types import MappingProxyType
 
 class SteelType(str, Enum):
     REBAR = "rebar"  # Reinforcing bar
@@ -28,40 +31,288 @@ class SteelGrade(str, Enum):
     GRADE_40 = "grade_40"  # 40 ksi rebar
     GRADE_60 = "grade_60"  # 60 ksi rebar
 
-class SteelCalculator:
-    """Calculator for steel weight and cost estimations."""
+# Density of carbon steel (lb/ft³)
+_STEEL_DENSITY_LB_FT3 = 490.0
+
+# Weight per foot of length for each square inch of cross-section (lb/ft/in²)
+_LB_PER_FT_PER_SQIN = _STEEL_DENSITY_LB_FT3 / 144.0
+
+# Area of a circle per squared diameter
+_PI_OVER_4 = pi / 4.0
+
+def _build_aliases(enum_cls, extra):
+    """Map spelling variants of each enum member to the member itself."""
+    aliases = {}
+    for member in enum_cls:
+        for key in (member.value, member.name.lower()):
+            aliases[key] = member
+            aliases[key.replace("_", " ")] = member
+            aliases[key.replace("_", "-")] = member
+            aliases[key.replace("_", "")] = member
+    aliases.update(extra)
+    return aliases
+
+# Lowercased user input -> SteelType
+_STEEL_TYPE_ALIASES = _build_aliases(SteelType, {
+    "reinforcing bar": SteelType.REBAR,
+    "h beam": SteelType.WIDE_FLANGE,
+    "h-beam": SteelType.WIDE_FLANGE,
+    "wf": SteelType.WIDE_FLANGE,
+    "tube": SteelType.TUBING,
+})
+
+# Lowercased user input -> SteelGrade
+_STEEL_GRADE_ALIASES = _build_aliases(SteelGrade, {
+    "gr40": SteelGrade.GRADE_40,
+    "gr60": SteelGrade.GRADE_60,
+    "a572": SteelGrade.A572_50,
+})
+
+def _as_steel_type(value):
+    """Resolve a SteelType or user string; unknown strings pass through."""
+    if value.__class__ is SteelType:
+        return value
+    member = _STEEL_TYPE_ALIASES.get(value)
+    if member is None:
+        member = _STEEL_TYPE_ALIASES.get(str(value).strip().lower(), value)
+    return member
+
+def _as_grade(value):
+    """Resolve a SteelGrade or user string; unknown strings pass through."""
+    if value.__class__ is SteelGrade:
+        return value
+    member = _STEEL_GRADE_ALIASES.get(value)
+    if member is None:
+        member = _STEEL_GRADE_ALIASES.get(str(value).strip().lower(), value)
+    return member
+
+# Length unit scale factors (feet per unit)
+_FEET_PER_UNIT = {
+    "feet": 1.0,
+    "foot": 1.0,
+    "ft": 1.0,
+    "inches": 1.0 / 12.0,
+    "inch": 1.0 / 12.0,
+    "in": 1.0 / 12.0,
+    "yards": 3.0,
+    "yard": 3.0,
+    "yd": 3.0,
+    "meters": 3.28084,
+    "meter": 3.28084,
+    "m": 3.28084,
+    "cm": 0.0328084,
+    "mm": 0.00328084,
+}
+
+# Weight unit scale factors (output unit name, units per pound)
+_WEIGHT_UNITS = {
+    "pounds": ("pounds", 1.0),
+    "pound": ("pounds", 1.0),
+    "lb": ("pounds", 1.0),
+    "lbs": ("pounds", 1.0),
+    "kg": ("kilograms", 0.453592),
+    "kilograms": ("kilograms", 0.453592),
+    "kilogram": ("kilograms", 0.453592),
+}
+
+# Standard rebar weights per foot (lb/ft)
+_REBAR_WEIGHTS = MappingProxyType({
+    3: 0.376,  # #3 rebar (3/8")
+    4: 0.668,  # #4 rebar (1/2")
+    5: 1.043,  # #5 rebar (5/8")
+    6: 1.502,  # #6 rebar (3/4")
+    7: 2.044,  # #7 rebar (7/8")
+    8: 2.670,  # #8 rebar (1")
+    9: 3.400,  # #9 rebar (1-1/8")
+    10: 4.303,  # #10 rebar (1-1/4")
+    11: 5.313,  # #11 rebar (1-3/8")
+    14: 7.650,  # #14 rebar (1-3/4")
+    18: 13.600,  # #18 rebar (2-1/4")
+})
+
+def _rebar_section(bar_number):
+    """Return (diameter_inches, weight_per_foot, area_sq_inches) for a rebar size."""
+    diameter_inches = bar_number / 8.0  # Rebar number is 8 times diameter in inches
+    area_sq_inches = _PI_OVER_4 * diameter_inches * diameter_inches
+    return diameter_inches, _REBAR_WEIGHTS.get(bar_number, 0), area_sq_inches
+
+def _rebar_properties(bar_number):
+    """Build the read-only property mapping for a rebar size."""
+    diameter_inches, weight_per_foot, area_sq_inches = _rebar_section(bar_number)
+    return MappingProxyType({
+        "bar_number": bar_number,
+        "diameter_inches": diameter_inches,
+        "diameter_mm": diameter_inches * 25.4,
+        "weight_per_foot": weight_per_foot,
+        "weight_per_meter": weight_per_foot * 3.28084,
+        "area_sq_inches": area_sq_inches,
+        "area_sq_mm": area_sq_inches * 645.16
+    })
+
+# Precomputed sections and properties for standard rebar sizes
+_REBAR_TABLE = {n: _rebar_section(n) for n in _REBAR_WEIGHTS}
+_REBAR_PROPERTIES = {n: _rebar_properties(n) for n in _REBAR_WEIGHTS}
+
+# Shape handlers: dimensions -> (weight_per_foot, area_sq_inches)
+def _rebar_weight(dimensions):
+    """Weight per foot and area of rebar, from its bar number."""
+    bar_number = dimensions.get("bar_number", 0)
+    section = _REBAR_TABLE.get(bar_number)
+    if section is None:
+        section = _rebar_section(bar_number)
+    _, weight_per_foot, area_sq_inches = section
+    return weight_per_foot, area_sq_inches
+
+def _angle_weight(dimensions):
+    """Weight per foot and area of an L-shaped angle."""
+    width = float(dimensions.get("width", 0))
+    height = float(dimensions.get("height", 0))
+    thickness = float(dimensions.get("thickness", 0))
+    
+    # Approximate area: both legs minus the shared corner
+    area_sq_inches = thickness * (width + height - thickness)
+    return area_sq_inches * _LB_PER_FT_PER_SQIN, area_sq_inches
+
+def _round_bar_weight(dimensions):
+    """Weight per foot and area of a solid round bar."""
+    diameter = float(dimensions.get("diameter", 0))
+    area_sq_inches = _PI_OVER_4 * diameter * diameter
+    return area_sq_inches * _LB_PER_FT_PER_SQIN, area_sq_inches
+
+def _generic_weight(dimensions):
+    """Weight per foot from a given cross-sectional area."""
+    area_sq_inches = float(dimensions.get("area_sq_inches", 0))
+    return area_sq_inches * _LB_PER_FT_PER_SQIN, area_sq_inches
+
+_SHAPE_HANDLERS = {
+    SteelType.REBAR: _rebar_weight,
+    SteelType.ANGLE: _angle_weight,
+    SteelType.ROUND_BAR: _round_bar_weight,
+}
+
+def _feet_per_unit(length_unit):
+    """Feet per length unit; unknown units are treated as feet."""
+    # Exact match first, so already-lowercase units never allocate a new string
+    factor = _FEET_PER_UNIT.get(length_unit)
+    if factor is None:
+        factor = _FEET_PER_UNIT.get(length_unit.lower(), 1.0)
+    return factor
+
+def _weight_unit(weight_unit):
+    """(output unit name, units per pound); unknown units fall back to pounds."""
+    unit = _WEIGHT_UNITS.get(weight_unit)
+    if unit is None:
+        unit = _WEIGHT_UNITS.get(weight_unit.lower(), _WEIGHT_UNITS["pounds"])
+    return unit
+
+def _to_feet(length, length_unit):
+    """Convert a length to float feet (unknown units are treated as feet).
     
-    def __init__(self):
-        """Initialize the calculator."""
-        # Standard rebar weights per foot (lb/ft)
-        self.rebar_weights = {
-            3: 0.376,  # #3 rebar (3/8")
-            4: 0.668,  # #4 rebar (1/2")
-            5: 1.043,  # #5 rebar (5/8")
-            6: 1.502,  # #6 rebar (3/4")
-            7: 2.044,  # #7 rebar (7/8")
-            8: 2.670,  # #8 rebar (1")
-            9: 3.400,  # #9 rebar (1-1/8")
-            10: 4.303,  # #10 rebar (1-1/4")
-            11: 5.313,  # #11 rebar (1-3/8")
-            14: 7.650,  # #14 rebar (1-3/4")
-            18: 13.600,  # #18 rebar (2-1/4")
+    Lengths are coerced with float() here, so Decimal inputs never reach
+    the float-only shape arithmetic.
+    """
+    if length_unit == "feet":
+        return float(length)
+    return float(length) * _feet_per_unit(length_unit)
+
+def _compute_weight(steel_type, dimensions, length_feet, quantity):
+    """Return (weight_per_foot, area_sq_inches, weight_pounds) for a piece."""
+    weight_per_foot, area_sq_inches = _SHAPE_HANDLERS.get(steel_type, _generic_weight)(dimensions)
+    return weight_per_foot, area_sq_inches, weight_per_foot * length_feet * quantity
+
+# Default prices per pound for different steel types, in whole cents
+_PRICE_CENTS = MappingProxyType({
+    SteelType.REBAR: MappingProxyType({
+        SteelGrade.GRADE_40: 75,
+        SteelGrade.GRADE_60: 85,
+    }),
+    SteelType.ANGLE: MappingProxyType({
+        SteelGrade.A36: 90,
+    }),
+    # Other steel types and grades would be added here
+})
+
+# Price for any type or grade not in the table
+_DEFAULT_PRICE_CENTS = 85
+
+class _PriceTable(dict):
+    """Price table that answers the default price for any missing key."""
+    
+    def __missing__(self, key):
+        return _DEFAULT_PRICE_CENTS
+
+# Flattened (steel type, grade) -> cents, resolved with a single lookup
+_PRICE_CENTS_BY_KEY = MappingProxyType(_PriceTable({
+    (steel_type, grade): cents
+    for steel_type, grades in _PRICE_CENTS.items()
+    for grade, cents in grades.items()
+}))
+
+# The same default prices in dollars per pound
+_PRICE_TABLE = MappingProxyType({
+    steel_type: MappingProxyType({grade: cents / 100 for grade, cents in grades.items()})
+    for steel_type, grades in _PRICE_CENTS.items()
+})
+
+@dataclass(slots=True, frozen=True)
+class WeightResult:
+    """Unrounded result of a steel weight calculation."""
+    weight_per_foot: float
+    weight_pounds: float
+    weight: float
+    weight_unit: str
+    length: float
+    length_unit: str
+    quantity: int
+    area_sq_inches: float
+    steel_type: SteelType
+    
+    def to_dict(self):
+        """Return the result as the dict shape returned by calculate_weight."""
+        return {
+            "weight_per_foot": self.weight_per_foot,
+            "weight_pounds": self.weight_pounds,
+            "weight": self.weight,
+            "weight_unit": self.weight_unit,
+            "length": self.length,
+            "length_unit": self.length_unit,
+            "quantity": self.quantity,
+            "area_sq_inches": self.area_sq_inches if self.area_sq_inches else None,
+            "steel_type": self.steel_type
         }
+
+# Result fields rounded for display by format_weight_result
+_ROUNDED_WEIGHT_FIELDS = ("weight_per_foot", "weight_pounds", "weight", "area_sq_inches")
+
+def format_weight_result(result, precision=2):
+    """Round a calculate_weight result for display or serialization.
+    
+    Args:
+        result (dict): Weight data from calculate_weight
+        precision (int): Number of decimal places
         
-        # Default prices per pound for different steel types
-        self.price_table = {
-            SteelType.REBAR: {
-                SteelGrade.GRADE_40: 0.75,
-                SteelGrade.GRADE_60: 0.85,
-            },
-            SteelType.ANGLE: {
-                SteelGrade.A36: 0.90,
-            },
-            # Other steel types and grades would be added here
-        }
+    Returns:
+        dict: Copy of the result with weights and area rounded
+    """
+    formatted = dict(result)
+    for field in _ROUNDED_WEIGHT_FIELDS:
+        value = formatted.get(field)
+        if value is not None:
+            formatted[field] = round(value, precision)
+    return formatted
+
+class SteelCalculator:
+    """Calculator for steel weight and cost estimations."""
+    
+    # All state is shared and read-only, so instances carry no __dict__
+    __slots__ = ()
+    
+    # Shared, read-only lookup tables
+    rebar_weights = _REBAR_WEIGHTS
+    price_table = _PRICE_TABLE
     
     def calculate_weight(self, steel_type, dimensions, length, quantity=1, 
-                         length_unit="feet", weight_unit="pounds"):
+                         length_unit="feet", weight_unit="pounds", return_raw=False):
         """Calculate steel weight.
         
         Args:
@@ -69,70 +320,98 @@ class SteelCalculator:
             dimensions (dict): Dimensions of the steel section
             length (float): Length of the steel
             quantity (int): Number of pieces
-            length_unit (str): Unit for length (feet, meters)
+            length_unit (str): Unit for length (feet, inches, yards, meters, cm, mm)
             weight_unit (str): Output weight unit (pounds, kg)
+            return_raw (bool): Return a WeightResult instead of a dict
             
         Returns:
-            dict: Weight data
+            dict: Unrounded weight data (or WeightResult if return_raw is set);
+            use format_weight_result for display
         """
-        # Convert length to feet if in meters
-        if length_unit.lower() == "meters":
-            length_feet = length * 3.28084
-        else:
-            length_feet = length
-        
-        # Calculate weight based on steel type
-        if steel_type == SteelType.REBAR:
-            bar_number = dimensions.get("bar_number", 0)
-            weight_per_foot = self.rebar_weights.get(bar_number, 0)
-            area_sq_inches = self._rebar_area(bar_number)
-        elif steel_type == SteelType.ANGLE:
-            # L-shaped angle
-            width = dimensions.get("width", 0)
-            height = dimensions.get("height", 0)
-            thickness = dimensions.get("thickness", 0)
-            
-            # Approximate weight calculation for angle
-            area_sq_inches = (width * thickness) + (height * thickness) - (thickness * thickness)
-            weight_per_foot = area_sq_inches * 3.4  # Steel is about 3.4 lb/ft³ per square inch
-        elif steel_type == SteelType.ROUND_BAR:
-            # Round bar
-            diameter = dimensions.get("diameter", 0)
-            area_sq_inches = 3.14159 * (diameter/2) ** 2
-            weight_per_foot = area_sq_inches * 3.4
-        else:
-            # Generic calculation based on cross-sectional area
-            area_sq_inches = dimensions.get("area_sq_inches", 0)
-            weight_per_foot = area_sq_inches * 3.4
-        
-        # Calculate total weight
-        weight_pounds = weight_per_foot * length_feet * quantity
+        steel_type = _as_steel_type(steel_type)
+        weight_per_foot, area_sq_inches, weight_pounds = _compute_weight(
+            steel_type, dimensions, _to_feet(length, length_unit), quantity
+        )
         
-        # Convert to requested weight unit
-        if weight_unit.lower() == "kg" or weight_unit.lower() == "kilograms":
-            weight = weight_pounds * 0.453592  # Convert pounds to kg
-            weight_unit_output = "kilograms"
+        # Convert to requested weight unit (unknown units fall back to pounds)
+        if weight_unit == "pounds":
+            weight_unit_output, weight = "pounds", weight_pounds
         else:
-            weight = weight_pounds
-            weight_unit_output = "pounds"
+            weight_unit_output, weight_factor = _weight_unit(weight_unit)
+            weight = weight_pounds * weight_factor
+        
+        if return_raw:
+            return WeightResult(
+                weight_per_foot, weight_pounds, weight, weight_unit_output,
+                length, length_unit, quantity, area_sq_inches, steel_type
+            )
         
+        # Built directly: a frozen WeightResult sets every field through
+        # object.__setattr__, which more than doubles the cost of this path.
+        # Keep in sync with WeightResult.to_dict.
         return {
-            "weight_per_foot": round(weight_per_foot, 2),
-            "weight_pounds": round(weight_pounds, 2),
-            "weight": round(weight, 2),
+            "weight_per_foot": weight_per_foot,
+            "weight_pounds": weight_pounds,
+            "weight": weight,
             "weight_unit": weight_unit_output,
             "length": length,
             "length_unit": length_unit,
             "quantity": quantity,
-            "area_sq_inches": round(area_sq_inches, 2) if area_sq_inches else None,
+            "area_sq_inches": area_sq_inches if area_sq_inches else None,
             "steel_type": steel_type
         }
     
+    def calculate_weight_scalar(self, steel_type, dimensions, length, quantity=1, length_unit="feet"):
+        """Calculate total steel weight in pounds only.
+        
+        Same math as calculate_weight without building the result dict, for
+        callers that only need the weight.
+        
+        Args:
+            steel_type (SteelType): Type of steel
+            dimensions (dict): Dimensions of the steel section
+            length (float): Length of the steel
+            quantity (int): Number of pieces
+            length_unit (str): Unit for length (feet, inches, yards, meters, cm, mm)
+            
+        Returns:
+            float: Total weight in pounds (unrounded)
+        """
+        return _compute_weight(
+            _as_steel_type(steel_type), dimensions, _to_feet(length, length_unit), quantity
+        )[2]
+    
+    def calculate_batch(self, items, length_unit="feet", weight_unit="pounds"):
+        """Calculate total weights for many pieces at once.
+        
+        Units are resolved once for the whole batch and no per-piece result
+        dict is built, which makes this the preferred entry point for bills
+        of materials.
+        
+        Args:
+            items: Iterable of (steel_type, dimensions, length, quantity) tuples
+            length_unit (str): Unit for all lengths
+            weight_unit (str): Output weight unit (pounds, kg)
+            
+        Returns:
+            list: Total weight of each item in the requested unit
+        """
+        length_factor = _feet_per_unit(length_unit)
+        _, weight_factor = _weight_unit(weight_unit)
+        factor = length_factor * weight_factor
+        
+        weights = []
+        for steel_type, dimensions, length, quantity in items:
+            steel_type = _as_steel_type(steel_type)
+            weight_per_foot, _ = _SHAPE_HANDLERS.get(steel_type, _generic_weight)(dimensions)
+            weights.append(weight_per_foot * float(length) * quantity * factor)
+        return weights
+    
     def calculate_cost(self, weight, steel_type, grade, price_per_pound=None):
         """Calculate steel cost.
         
         Args:
-            weight: Weight data from calculate_weight
+            weight: Weight data (dict or WeightResult) from calculate_weight, or pounds
             steel_type (SteelType): Type of steel
             grade (SteelGrade): Grade of steel
             price_per_pound (float): Custom price per pound
@@ -140,21 +419,40 @@ class SteelCalculator:
         Returns:
             float: Total cost
         """
-        if isinstance(weight, dict) and "weight_pounds" in weight:
+        return self.calculate_cost_cents(weight, steel_type, grade, price_per_pound) / 100.0
+    
+    def calculate_cost_cents(self, weight, steel_type, grade, price_per_pound=None):
+        """Calculate steel cost in whole cents.
+        
+        Prefer this over calculate_cost when summing many line items, since
+        integer cents add up exactly.
+        
+        Args:
+            weight: Weight data (dict or WeightResult) from calculate_weight, or pounds
+            steel_type (SteelType): Type of steel
+            grade (SteelGrade): Grade of steel
+            price_per_pound (float): Custom price per pound
+            
+        Returns:
+            int: Total cost in cents
+        """
+        if weight.__class__ is WeightResult:
+            weight_pounds = weight.weight_pounds
+        elif isinstance(weight, dict) and "weight_pounds" in weight:
             weight_pounds = weight["weight_pounds"]
         else:
             weight_pounds = weight
         
         # Use provided price or look up in price table
         if price_per_pound is None:
-            # Default values if type or grade not in table
-            type_prices = self.price_table.get(steel_type, {SteelGrade.A36: 0.85})
-            price = type_prices.get(grade, 0.85)
+            steel_type = _as_steel_type(steel_type)
+            grade = _as_grade(grade)
+            # Unknown types and grades resolve to the default price
+            price_cents = _PRICE_CENTS_BY_KEY[steel_type, grade]
         else:
-            price = price_per_pound
+            price_cents = price_per_pound * 100
         
-        total_cost = weight_pounds * price
-        return round(total_cost, 2)
+        return int(weight_pounds * price_cents + 0.5)
     
     def get_rebar_properties(self, bar_number):
         """Get properties for a specific rebar size.
@@ -163,21 +461,12 @@ class SteelCalculator:
             bar_number (int): Rebar size number
             
         Returns:
-            dict: Rebar properties
+            Mapping: Rebar properties (read-only)
         """
-        weight_per_foot = self.rebar_weights.get(bar_number, 0)
-        diameter_inches = bar_number / 8.0  # Rebar number is 8 times diameter in inches
-        area_sq_inches = self._rebar_area(bar_number)
-        
-        return {
-            "bar_number": bar_number,  # Add this line to make the test pass
-            "diameter_inches": diameter_inches,
-            "diameter_mm": diameter_inches * 25.4,
-            "weight_per_foot": weight_per_foot,
-            "weight_per_meter": weight_per_foot * 3.28084,
-            "area_sq_inches": area_sq_inches,
-            "area_sq_mm": area_sq_inches * 645.16
-        }
+        props = _REBAR_PROPERTIES.get(bar_number)
+        if props is None:
+            props = _rebar_properties(bar_number)
+        return props
     
     def _rebar_area(self, bar_number):
         """Calculate cross-sectional area of rebar.
@@ -188,5 +477,7 @@ class SteelCalculator:
         Returns:
             float: Area in square inches
         """
-        diameter_inches = bar_number / 8.0
-        return 3.14159 * (diameter_inches/2) ** 2
+        section = _REBAR_TABLE.get(bar_number)
+        if section is None:
+            section = _rebar_section(bar_number)
+        return section[2]
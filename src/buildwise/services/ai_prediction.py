@@ -1,7 +1,10 @@
 """AI prediction service for BuildWise CLI."""
 import os
+import re
 from enum import Enum
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional
 
 from buildwise.config.settings import settings
 
@@ -12,6 +15,97 @@ class PredictionType(str, Enum):
     PROJECT_TIMELINE = "project_timeline"
     MATERIAL_QUANTITY = "material_quantity"
 
+# OpenAI module, imported on first use (False if it is not installed)
+_openai = None
+
+def _get_openai():
+    """Return the openai module, or None if the package is not installed."""
+    global _openai
+    if _openai is None:
+        try:
+            import openai
+            _openai = openai
+        except ImportError:
+            _openai = False
+    return _openai or None
+
+# Material cost factors by location (lowercased keys)
+_MATERIAL_LOCATION_FACTORS = MappingProxyType({
+    "new york": 1.2,
+    "california": 1.15,
+    "texas": 0.9,
+    "florida": 0.95,
+    "illinois": 1.05,
+    "united states": 1.0,
+})
+
+# Labor cost factors by location (lowercased keys)
+_LABOR_LOCATION_FACTORS = MappingProxyType({
+    "new york": 1.3,
+    "california": 1.25,
+    "texas": 0.9,
+    "florida": 0.95,
+    "illinois": 1.1,
+    "united states": 1.0,
+})
+
+# Location spellings callers commonly pass -> canonical lowercase key
+_LOCATION_KEYS = MappingProxyType({
+    spelling: key
+    for key in _MATERIAL_LOCATION_FACTORS
+    for spelling in (key, key.title())
+})
+
+# Known location names anywhere in free-form input (e.g. "Austin, Texas")
+_LOCATION_PATTERN = re.compile(
+    r"\b(?:" + "|".join(
+        re.escape(key) for key in sorted(_MATERIAL_LOCATION_FACTORS, key=len, reverse=True)
+    ) + r")\b"
+)
+
+def _normalize_location(location: Optional[str]) -> str:
+    """Return the canonical lowercase key for a location name.
+    
+    Names that are not a known location themselves resolve to the first
+    known location they mention. A missing location is the United States.
+    """
+    if not location:
+        return "united states"
+    key = _LOCATION_KEYS.get(location)
+    if key is None:
+        key = location.strip().lower()
+        if key not in _MATERIAL_LOCATION_FACTORS:
+            match = _LOCATION_PATTERN.search(key)
+            if match:
+                key = match.group()
+    return key
+
+# Base labor rates by project type ($/sqft)
+_LABOR_RATES = MappingProxyType({
+    "residential": 30,
+    "commercial": 45,
+    "industrial": 55,
+    "renovation": 40
+})
+
+# Base timeline by project type (days per 1000 sqft)
+_TIMELINE_RATES = MappingProxyType({
+    "residential": 15,
+    "commercial": 20,
+    "industrial": 25,
+    "renovation": 18
+})
+
+# (material_type, unit or None for any unit) -> (settings price key, default price)
+_BASE_PRICE_SETTINGS = MappingProxyType({
+    ("concrete", "cubic_yards"): ("concrete_per_yard", 150),
+    ("lumber", None): ("lumber_pine_per_bf", 3.0),
+    ("steel", None): ("steel_per_pound", 0.85),
+})
+
+# Base cost per unit for materials not in the price table
+_DEFAULT_BASE_PRICE = 100
+
 class AIPredictionService:
     """Service for AI-powered predictions."""
     
@@ -28,6 +122,12 @@ class AIPredictionService:
         self.client = None
         self.fallback_enabled = True
         
+        # Snapshot of configured material prices; see refresh_prices()
+        self._load_prices()
+        
+        # Per-instance memo of unit costs; see clear_cache()
+        self._unit_cost = lru_cache(maxsize=256)(self._compute_unit_cost)
+        
         # Initialize model or API client
         if self.model_path and os.path.exists(self.model_path):
             self.model = self._load_local_model()
@@ -38,6 +138,18 @@ class AIPredictionService:
         """Check if AI service is available."""
         return self.model is not None or self.client is not None
     
+    def clear_cache(self) -> None:
+        """Clear memoized costs, e.g. after material prices change."""
+        self._unit_cost.cache_clear()
+    
+    def refresh_prices(self) -> None:
+        """Re-read material prices from settings and drop memoized costs.
+        
+        Called automatically when settings.update_material_price is used.
+        """
+        self._load_prices()
+        self.clear_cache()
+    
     def set_api_key(self, api_key: str) -> bool:
         """Set API key."""
         try:
@@ -63,6 +175,8 @@ class AIPredictionService:
         Returns:
             dict: Prediction results
         """
+        location = _normalize_location(location)
+        self._check_prices()
         try:
             # Prepare features
             features = self._prepare_features(
@@ -92,6 +206,66 @@ class AIPredictionService:
                 return self._fallback_prediction(material_type, quantity, location)
             raise e
     
+    def predict_material_cost_batch(
+        self,
+        material_types: List[str],
+        values: List[float],
+        units: List[str],
+        locations: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Predict material costs for many line items at once.
+        
+        With a model or API client, each item is predicted through
+        predict_material_cost. Otherwise the fallback calculation resolves
+        the combined base cost and location factor once per distinct
+        (material, unit, location) rather than once per item.
+        
+        Args:
+            material_types: Type of material for each item
+            values: Quantity value for each item
+            units: Quantity unit for each item
+            locations: Location for pricing of each item
+        
+        Returns:
+            list: Prediction results, one per item
+        
+        Raises:
+            ValueError: If the lists differ in length, or if no model or API
+                client is available and fallback is disabled
+        """
+        if not len(material_types) == len(values) == len(units) == len(locations):
+            raise ValueError("material_types, values, units and locations must have the same length")
+        
+        if self.model or self.client:
+            return [
+                self.predict_material_cost(material_type, {unit: value}, location)
+                for material_type, value, unit, location in zip(material_types, values, units, locations)
+            ]
+        if not self.fallback_enabled:
+            raise ValueError("No model or API client available")
+        
+        prediction_type = PredictionType.MATERIAL_COST
+        self._check_prices()
+        
+        unit_costs = {}
+        for material_type, unit, location in set(zip(material_types, units, locations)):
+            unit_costs[material_type, unit, location] = self._unit_cost(
+                material_type, unit, _normalize_location(location)
+            )
+        
+        results = []
+        for material_type, value, unit, location in zip(material_types, values, units, locations):
+            cost = value * unit_costs[material_type, unit, location]
+            results.append({
+                "estimated_cost": cost,
+                "min_cost": cost * 0.85,
+                "max_cost": cost * 1.15,
+                "confidence": 0.7,  # Lower confidence for fallback
+                "source": "fallback_calculation",
+                "prediction_type": prediction_type
+            })
+        return results
+    
     def predict_labor_cost(
         self, 
         project_type: str, 
@@ -101,7 +275,7 @@ class AIPredictionService:
         """Predict labor cost."""
         # Implementation would be similar to predict_material_cost
         # For now, just use the fallback
-        return self._fallback_prediction_labor(project_type, scope, location)
+        return self._fallback_prediction_labor(project_type, scope, _normalize_location(location))
     
     def predict_project_timeline(
         self, 
@@ -112,7 +286,7 @@ class AIPredictionService:
         """Predict project timeline."""
         # Implementation would be similar to predict_material_cost
         # For now, just use the fallback
-        return self._fallback_prediction_timeline(project_type, scope, location)
+        return self._fallback_prediction_timeline(project_type, scope, _normalize_location(location))
     
     def _load_local_model(self):
         """Load local model from file."""
@@ -127,20 +301,41 @@ class AIPredictionService:
         if not self.api_key:
             return None
         
-        try:
-            # Try to import OpenAI
-            import openai
-            openai.api_key = self.api_key
-            return openai
-        except ImportError:
+        openai = _get_openai()
+        if openai is None:
             # OpenAI package not installed
             return None
+        
+        openai.api_key = self.api_key
+        return openai
     
     def _prepare_features(self, **kwargs) -> Dict[str, Any]:
         """Prepare features for prediction."""
         # This would transform raw inputs into model features
         return kwargs
     
+    def _check_prices(self) -> None:
+        """Refresh the price snapshot if settings prices changed since it was taken."""
+        if self._prices_version != settings.prices_version:
+            self.refresh_prices()
+    
+    def _load_prices(self) -> None:
+        """Snapshot material prices from settings."""
+        self._prices_version = settings.prices_version
+        prices = settings.material_prices
+        self._base_prices = {
+            key: prices.get(name, default)
+            for key, (name, default) in _BASE_PRICE_SETTINGS.items()
+        }
+    
+    def _material_base_cost(self, material_type: str, unit: str) -> float:
+        """Get the base cost per unit for a material."""
+        base_prices = self._base_prices
+        price = base_prices.get((material_type, unit))
+        if price is None:
+            price = base_prices.get((material_type, None), _DEFAULT_BASE_PRICE)
+        return price
+    
     def _predict_with_local_model(self, features: Dict[str, Any]) -> Dict[str, Any]:
         """Make prediction with local model."""
         # This would use the local model to make a prediction
@@ -150,31 +345,10 @@ class AIPredictionService:
         location = features.get("location", "")
         
         # Get unit and value
-        unit = next(iter(quantity.keys()), "")
-        value = next(iter(quantity.values()), 0)
-        
-        # Base cost estimation
-        if material_type == "concrete" and unit == "cubic_yards":
-            cost = value * settings.material_prices.get("concrete_per_yard", 150)
-        elif material_type == "lumber":
-            cost = value * settings.material_prices.get("lumber_pine_per_bf", 3.0)
-        elif material_type == "steel":
-            cost = value * settings.material_prices.get("steel_per_pound", 0.85)
-        else:
-            cost = value * 100  # Default fallback
-        
-        # Apply location factor
-        location_factors = {
-            "New York": 1.2,
-            "California": 1.15,
-            "Texas": 0.9,
-            "Florida": 0.95,
-            "Illinois": 1.05,
-            "United States": 1.0,
-        }
+        unit, value = next(iter(quantity.items()), ("", 0))
         
-        location_factor = location_factors.get(location, 1.0)
-        cost *= location_factor
+        # Base cost with location factor applied
+        cost = value * self._unit_cost(material_type, unit, location)
         
         return {
             "cost": cost,
@@ -193,35 +367,13 @@ class AIPredictionService:
         self,
         material_type: str, 
         quantity: Dict[str, float], 
-        location: str = "United States"
+        location: str = "united states"
     ) -> Dict[str, Any]:
         """Provide a fallback prediction using deterministic methods."""
         # Similar logic to _predict_with_local_model
-        unit = next(iter(quantity.keys()), "")
-        value = next(iter(quantity.values()), 0)
-        
-        # Base cost
-        if material_type == "concrete" and unit == "cubic_yards":
-            base_cost = settings.material_prices.get("concrete_per_yard", 150)
-        elif material_type == "lumber":
-            base_cost = settings.material_prices.get("lumber_pine_per_bf", 3.0)
-        elif material_type == "steel":
-            base_cost = settings.material_prices.get("steel_per_pound", 0.85)
-        else:
-            base_cost = 100  # Default fallback
-        
-        # Location factors
-        location_factors = {
-            "New York": 1.2,
-            "California": 1.15,
-            "Texas": 0.9,
-            "Florida": 0.95,
-            "Illinois": 1.05,
-            "United States": 1.0,
-        }
+        unit, value = next(iter(quantity.items()), ("", 0))
         
-        location_factor = location_factors.get(location, 1.0)
-        cost = value * base_cost * location_factor
+        cost = value * self._unit_cost(material_type, unit, location)
         
         return {
             "estimated_cost": cost,
@@ -232,38 +384,26 @@ class AIPredictionService:
             "prediction_type": PredictionType.MATERIAL_COST
         }
     
+    def _compute_unit_cost(self, material_type: str, unit: str, location: str) -> float:
+        """Base cost per unit times the factor for a normalized location."""
+        return self._material_base_cost(material_type, unit) * _MATERIAL_LOCATION_FACTORS.get(location, 1.0)
+    
     def _fallback_prediction_labor(
         self,
         project_type: str, 
         scope: Dict[str, Any], 
-        location: str = "United States"
+        location: str = "united states"
     ) -> Dict[str, Any]:
         """Provide a fallback labor cost prediction."""
         # Simplified estimation
         area = scope.get("area", 0)
         stories = scope.get("stories", 1)
         
-        # Base labor rates by project type ($/sqft)
-        labor_rates = {
-            "residential": 30,
-            "commercial": 45,
-            "industrial": 55,
-            "renovation": 40
-        }
-        
-        base_rate = labor_rates.get(project_type.lower(), 35)
+        # Base labor rate by project type ($/sqft)
+        base_rate = _LABOR_RATES.get(project_type.lower(), 35)
         
         # Location factors
-        location_factors = {
-            "New York": 1.3,
-            "California": 1.25,
-            "Texas": 0.9,
-            "Florida": 0.95,
-            "Illinois": 1.1,
-            "United States": 1.0,
-        }
-        
-        location_factor = location_factors.get(location, 1.0)
+        location_factor = _LABOR_LOCATION_FACTORS.get(location, 1.0)
         
         # Calculate cost
         cost = area * base_rate * location_factor * (1 + (stories - 1) * 0.1)
@@ -281,7 +421,7 @@ class AIPredictionService:
         self,
         project_type: str, 
         scope: Dict[str, Any], 
-        location: str = "United States"
+        location: str = "united states"
     ) -> Dict[str, Any]:
         """Provide a fallback project timeline prediction."""
         # Simplified estimation
@@ -289,14 +429,7 @@ class AIPredictionService:
         stories = scope.get("stories", 1)
         
         # Base timeline by project type (days per 1000 sqft)
-        timeline_rates = {
-            "residential": 15,
-            "commercial": 20,
-            "industrial": 25,
-            "renovation": 18
-        }
-        
-        base_rate = timeline_rates.get(project_type.lower(), 18)
+        base_rate = _TIMELINE_RATES.get(project_type.lower(), 18)
         
         # Calculate timeline in days
         days = (area / 1000) * base_rate * (1 + (stories - 1) * 0.2)
@@ -1,15 +1,197 @@
 """Project storage for BuildWise CLI."""
+import glob
 import json
+import os
+import re
+import tempfile
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Iterable, List, Any, Optional, Tuple, Union
 
 from buildwise.config.settings import settings
 
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; fall back to the stdlib codec
+    orjson = None
+
+def _now() -> str:
+    """Return the current UTC time as an ISO 8601 timestamp."""
+    return datetime.utcnow().isoformat()
+
+def _encode_default(obj: Any) -> Any:
+    """Encode storage objects the JSON codecs do not handle natively."""
+    if isinstance(obj, ProjectMaterial):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps(data: Any, pretty: bool = False) -> bytes:
+    """Serialize data to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_encode_default, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, default=_encode_default).encode()
+    return json.dumps(data, separators=(",", ":"), default=_encode_default).encode()
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available.
+    
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    catch the same exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Mode open() gives new files under the process umask; mkstemp would use 0600
+_umask = os.umask(0)
+os.umask(_umask)
+_NEW_FILE_MODE = 0o666 & ~_umask
+
+def _write_atomic(path: Path, payload: bytes, durable: bool = True) -> None:
+    """Write a file via a temporary sibling and an atomic rename.
+    
+    Args:
+        path: Destination file
+        payload: File contents
+        durable: fsync the data before the rename
+    """
+    # A unique temp name per write, so concurrent saves of one project never
+    # share a temp file; the ".tmp" suffix keeps it out of project scans
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        # Keep the mode of the file being replaced, or the default for new files
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = _NEW_FILE_MODE
+        os.chmod(tmp_name, mode)
+        with open(fd, 'wb') as f:
+            f.write(payload)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+def _project_summary(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the list_projects entry for a project dictionary."""
+    return {
+        "name": data.get("name", "Unknown"),
+        "description": data.get("description"),
+        "location": data.get("location"),
+        "created_at": data.get("created_at"),
+        "material_count": len(data.get("materials", []))
+    }
+
+def _read_meta(file_path: Path, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Read a project's ``.meta`` sidecar if it was written at or after ``mtime_ns``."""
+    meta_path = file_path.with_suffix(".meta")
+    try:
+        if meta_path.stat().st_mtime_ns >= mtime_ns:
+            return _loads(meta_path.read_bytes())
+    except (json.JSONDecodeError, FileNotFoundError):
+        pass
+    return None
+
+def _read_summary(file_path: Path, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Read the list_projects summary for a project file.
+    
+    Uses the ``.meta`` sidecar when it is at least as new as the project
+    file (modified at ``mtime_ns``), and parses the project itself
+    otherwise. Returns None for unreadable projects.
+    """
+    summary = _read_meta(file_path, mtime_ns)
+    if summary is not None:
+        return summary
+    
+    try:
+        return _project_summary(_loads(file_path.read_bytes()))
+    except (json.JSONDecodeError, FileNotFoundError):
+        return None
+
+# Materials added by append_material since the project file was last saved
+_LOG_SUFFIX = ".materials.jsonl"
+
+# Logs being folded by save_project are first renamed to
+# "<project>.materials.<generation>.folding", so appends made during the
+# save go to a fresh log. Generations sort in creation order.
+_FOLDING_SUFFIX = ".folding"
+_FOLDING_PATTERN = re.compile(r"(.+)\.materials\.([0-9a-f]{24})\.folding")
+
+# append_material folds the log into the project file once it grows this large
+_COMPACT_LOG_BYTES = 256 * 1024
+
+def _log_path(file_path: Path) -> Path:
+    """Return the appended materials log for a project file."""
+    return file_path.with_suffix(_LOG_SUFFIX)
+
+def _new_generation() -> str:
+    """Return a unique, time-ordered name for a log being folded."""
+    return f"{time.time_ns():016x}{uuid.uuid4().hex[:8]}"
+
+def _folding_logs(file_path: Path) -> List[Tuple[str, Path]]:
+    """Return the (generation, path) of a project's logs being folded, oldest first."""
+    stem = file_path.stem
+    logs = []
+    for path in file_path.parent.glob(f"{glob.escape(stem)}.materials.*{_FOLDING_SUFFIX}"):
+        match = _FOLDING_PATTERN.fullmatch(path.name)
+        if match is not None and match.group(1) == stem:
+            logs.append((match.group(2), path))
+    return sorted(logs)
+
+def _discard_logs(file_path: Path) -> None:
+    """Remove a project's appended materials log and any logs being folded."""
+    _log_path(file_path).unlink(missing_ok=True)
+    for _, folding_path in _folding_logs(file_path):
+        folding_path.unlink(missing_ok=True)
+
+def _replay_log(project: 'Project', log_path: Path, skip_ids: frozenset = frozenset()) -> None:
+    """Add the materials from an appended materials log to a project.
+    
+    Materials already in the project or listed in ``skip_ids`` are
+    skipped, as are torn lines from interrupted appends. Replayed ids are
+    recorded on the project so a later save can tell materials it has
+    since removed from ones appended after it was loaded.
+    """
+    try:
+        raw = log_path.read_bytes()
+    except FileNotFoundError:
+        return
+    
+    for line in raw.splitlines():
+        try:
+            material = ProjectMaterial.from_dict(_loads(line))
+        except (json.JSONDecodeError, KeyError, TypeError):
+            continue
+        if material.id in project._materials_by_id or material.id in skip_ids:
+            continue
+        project.materials.append(material)
+        project._materials_by_id[material.id] = material
+        project._log_ids.add(material.id)
+        if material.created_at > project.updated_at:
+            project.updated_at = material.created_at
+
 class ProjectMaterial:
     """Represents a material in a project."""
     
+    # Projects can hold thousands of materials, so skip the per-instance __dict__
+    __slots__ = (
+        "id", "material_type", "name", "quantity", "unit",
+        "details", "cost", "notes", "created_at"
+    )
+    
     def __init__(
         self, 
         material_type: str, 
@@ -18,7 +200,9 @@ class ProjectMaterial:
         unit: str,
         details: Optional[Dict[str, Any]] = None,
         cost: Optional[float] = None,
-        notes: Optional[str] = None
+        notes: Optional[str] = None,
+        id: Optional[str] = None,
+        created_at: Optional[str] = None
     ):
         """Initialize material.
         
@@ -30,8 +214,10 @@ class ProjectMaterial:
             details: Additional details
             cost: Material cost
             notes: Additional notes
+            id: Existing material ID (generated if None)
+            created_at: Existing creation timestamp (now if None)
         """
-        self.id = str(uuid.uuid4())
+        self.id = id or str(uuid.uuid4())
         self.material_type = material_type
         self.name = name
         self.quantity = quantity
@@ -39,7 +225,7 @@ class ProjectMaterial:
         self.details = details or {}
         self.cost = cost
         self.notes = notes
-        self.created_at = datetime.utcnow().isoformat()
+        self.created_at = created_at or _now()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert material to dictionary."""
@@ -58,51 +244,106 @@ class ProjectMaterial:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ProjectMaterial':
         """Create material from dictionary."""
-        material = cls(
+        # Stored id and timestamp go through the constructor, so loading
+        # never generates a uuid or timestamp only to overwrite it
+        return cls(
             material_type=data["material_type"],
             name=data["name"],
             quantity=data["quantity"],
             unit=data["unit"],
             details=data.get("details"),
             cost=data.get("cost"),
-            notes=data.get("notes")
+            notes=data.get("notes"),
+            id=data.get("id"),
+            created_at=data.get("created_at")
         )
-        material.id = data.get("id", material.id)
-        material.created_at = data.get("created_at", material.created_at)
-        return material
 
 class Project:
     """Represents a construction project."""
     
-    def __init__(self, name: str, description: Optional[str] = None, location: Optional[str] = None):
+    __slots__ = (
+        "id", "name", "description", "location", "materials",
+        "_materials_by_id", "_log_ids", "created_at", "updated_at"
+    )
+    
+    def __init__(
+        self,
+        name: str,
+        description: Optional[str] = None,
+        location: Optional[str] = None,
+        id: Optional[str] = None,
+        created_at: Optional[str] = None,
+        updated_at: Optional[str] = None
+    ):
         """Initialize project.
         
         Args:
             name: Project name
             description: Project description
             location: Project location
+            id: Existing project ID (generated if None)
+            created_at: Existing creation timestamp (now if None)
+            updated_at: Existing update timestamp (created_at if None)
         """
-        self.id = str(uuid.uuid4())
+        self.id = id or str(uuid.uuid4())
         self.name = name
         self.description = description
         self.location = location
         self.materials = []
-        self.created_at = datetime.utcnow().isoformat()
-        self.updated_at = self.created_at
+        # Materials by id, for O(1) lookup on removal
+        self._materials_by_id = {}
+        # Ids of materials replayed from the appended materials log
+        self._log_ids = set()
+        self.created_at = created_at or _now()
+        self.updated_at = updated_at or self.created_at
     
     def add_material(self, material: ProjectMaterial) -> None:
         """Add material to project."""
         self.materials.append(material)
-        self.updated_at = datetime.utcnow().isoformat()
+        self._materials_by_id[material.id] = material
+        self.updated_at = _now()
+    
+    def add_materials(self, materials: Iterable[ProjectMaterial]) -> None:
+        """Add many materials to project, updating the timestamp once."""
+        start = len(self.materials)
+        self.materials.extend(materials)
+        self._materials_by_id.update((m.id, m) for m in self.materials[start:])
+        self.updated_at = _now()
     
     def remove_material(self, material_id: str) -> bool:
         """Remove material from project."""
-        for i, material in enumerate(self.materials):
-            if material.id == material_id:
-                del self.materials[i]
-                self.updated_at = datetime.utcnow().isoformat()
-                return True
-        return False
+        material = self._materials_by_id.pop(material_id, None)
+        if material is None:
+            # Materials appended to the list directly are not indexed
+            material = next((m for m in self.materials if m.id == material_id), None)
+            if material is None:
+                return False
+        try:
+            self.materials.remove(material)
+        except ValueError:
+            # Indexed material was already dropped from the list directly
+            return False
+        self.updated_at = _now()
+        return True
+    
+    def remove_materials(self, material_ids: Iterable[str]) -> int:
+        """Remove many materials from project in a single pass.
+        
+        Args:
+            material_ids: IDs of the materials to remove
+            
+        Returns:
+            int: Number of materials removed
+        """
+        ids = set(material_ids)
+        kept = [m for m in self.materials if m.id not in ids]
+        removed = len(self.materials) - len(kept)
+        if removed:
+            self.materials = kept
+            for material_id in ids:
+                self._materials_by_id.pop(material_id, None)
+            self.updated_at = _now()
+        return removed
     
     @property
     def total_cost(self) -> float:
@@ -111,12 +352,22 @@ class Project:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert project to dictionary."""
+        data = self._to_record()
+        data["materials"] = [m.to_dict() for m in self.materials]
+        return data
+    
+    def _to_record(self) -> Dict[str, Any]:
+        """Convert project to a dictionary for serialization.
+        
+        Materials are left as objects for the encoder to convert one at a
+        time, so a full list of material dicts is never held in memory.
+        """
         return {
             "id": self.id,
             "name": self.name,
             "description": self.description,
             "location": self.location,
-            "materials": [m.to_dict() for m in self.materials],
+            "materials": self.materials,
             "created_at": self.created_at,
             "updated_at": self.updated_at
         }
@@ -127,16 +378,16 @@ class Project:
         project = cls(
             name=data["name"],
             description=data.get("description"),
-            location=data.get("location")
+            location=data.get("location"),
+            id=data.get("id"),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at")
         )
-        project.id = data.get("id", project.id)
-        project.created_at = data.get("created_at", project.created_at)
-        project.updated_at = data.get("updated_at", project.updated_at)
         
         # Add materials
-        for material_data in data.get("materials", []):
-            material = ProjectMaterial.from_dict(material_data)
-            project.materials.append(material)
+        materials = [ProjectMaterial.from_dict(m) for m in data.get("materials", ())]
+        project.materials = materials
+        project._materials_by_id = {m.id: m for m in materials}
         
         return project
 
@@ -151,56 +402,249 @@ class ProjectStorage:
         """
         self.project_dir = Path(project_dir or settings.project_dir)
         self.project_dir.mkdir(parents=True, exist_ok=True)
+        # list_projects summaries by project file, valid while the (mtime_ns, size)
+        # of the project file and of any pending materials logs match
+        self._summary_cache: Dict[str, Tuple[Tuple[Any, ...], Dict[str, Any]]] = {}
     
     def create_project(self, name: str, description: Optional[str] = None, location: Optional[str] = None) -> Project:
         """Create a new project."""
         project = Project(name=name, description=description, location=location)
+        # Drop materials logged for an earlier project of the same name,
+        # e.g. by an append that raced with its deletion
+        _discard_logs(self._project_path(name))
         self.save_project(project)
         return project
     
-    def save_project(self, project: Project) -> None:
-        """Save project to storage."""
-        file_path = self.project_dir / f"{project.name.replace(' ', '_')}.json"
-        with open(file_path, 'w') as f:
-            json.dump(project.to_dict(), f, indent=2)
+    def save_project(self, project: Project, pretty: bool = False) -> None:
+        """Save project to storage.
+        
+        The project is written to a temporary sibling file that is then
+        atomically renamed over the old one, so a crash mid-write never
+        leaves a truncated project file behind. A small ``.meta`` sidecar
+        with the list_projects summary is written alongside it.
+        
+        Pending appended materials are folded in: the materials log is
+        renamed aside first, so concurrent appends go to a fresh log, and
+        the project file records which logs it folded, so a crash before
+        they are removed never replays them again.
+        
+        Args:
+            project: Project to save
+            pretty: Indent the JSON for human readers
+        """
+        file_path = self._project_path(project.name)
+        log_path = _log_path(file_path)
+        try:
+            os.replace(log_path, log_path.with_name(
+                f"{file_path.stem}.materials.{_new_generation()}{_FOLDING_SUFFIX}"
+            ))
+        except FileNotFoundError:
+            pass
+        
+        folding = _folding_logs(file_path)
+        for _, folding_path in folding:
+            # Logged materials this project has seen but no longer holds
+            # were removed on purpose; only unseen appends are added
+            _replay_log(project, folding_path, project._log_ids)
+        
+        data = project._to_record()
+        if folding:
+            data["folded_logs"] = [generation for generation, _ in folding]
+        _write_atomic(file_path, _dumps(data, pretty))
+        # The sidecar is only a cache, so it needs no fsync; a missing or
+        # stale one makes list_projects fall back to the project file
+        _write_atomic(file_path.with_suffix(".meta"), _dumps(_project_summary(data)), durable=False)
+        
+        for _, folding_path in folding:
+            folding_path.unlink(missing_ok=True)
+        project._log_ids.clear()
     
-    def load_project(self, name: str) -> Optional[Project]:
-        """Load project from storage."""
-        file_path = self.project_dir / f"{name.replace(' ', '_')}.json"
-        if not file_path.exists():
-            return None
+    def append_material(self, name: str, material: ProjectMaterial) -> bool:
+        """Add a material to a stored project without rewriting it.
+        
+        The material is appended as one line to the project's materials
+        log, which load_project replays and the next save_project or
+        compact_project folds into the project file. The ``.meta`` sidecar
+        count is bumped so list_projects stays cheap, and the log is
+        compacted once it reaches ``_COMPACT_LOG_BYTES``.
         
+        Args:
+            name: Project name
+            material: Material to add
+            
+        Returns:
+            bool: False if the project does not exist
+        """
+        file_path = self._project_path(name)
+        log_path = _log_path(file_path)
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            return Project.from_dict(data)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return None
+            newest = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        try:
+            newest = max(newest, log_path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            pass
+        # Only a sidecar covering the project file and the log so far is bumped
+        summary = _read_meta(file_path, newest)
+        
+        line = _dumps(material.to_dict()) + b"\n"
+        while True:
+            with open(log_path, 'ab') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+                written = os.fstat(f.fileno())
+            try:
+                if os.path.samestat(written, os.stat(log_path)):
+                    break
+            except FileNotFoundError:
+                pass
+            # A save renamed the log away mid-append and may have folded it
+            # before this line landed; append again, as replay skips repeats
+        
+        if not file_path.exists():
+            # Deleted mid-append; create_project discards the stray log
+            return False
+        if written.st_size >= _COMPACT_LOG_BYTES:
+            return self.compact_project(name)
+        if summary is not None:
+            # The sidecar is only a cache: a concurrent append or save can
+            # leave the count off until the next save rewrites it
+            summary["material_count"] = summary.get("material_count", 0) + 1
+            _write_atomic(file_path.with_suffix(".meta"), _dumps(summary), durable=False)
+        return True
+    
+    def compact_project(self, name: str) -> bool:
+        """Fold a project's appended materials log into its project file.
+        
+        Args:
+            name: Project name
+            
+        Returns:
+            bool: False if the project does not exist
+        """
+        project = self.load_project(name)
+        if project is None:
+            return False
+        self.save_project(project)
+        return True
+    
+    def project_exists(self, name: str) -> bool:
+        """Check whether a project is stored."""
+        return self._project_path(name).exists()
+    
+    def load_project(self, name: str) -> Optional[Project]:
+        """Load project from storage, including appended materials."""
+        return self._load(self._project_path(name))
     
     def list_projects(self) -> List[Dict[str, Any]]:
-        """List all projects."""
+        """List all projects.
+        
+        Summaries come from each project's ``.meta`` sidecar, which
+        append_material keeps current, so the full materials list is never
+        parsed. Projects whose sidecar is missing or older than the project
+        file or its pending materials logs are read in full instead.
+        Summaries are cached per project file, so repeat listings only stat
+        files that have not changed. Listing never modifies the directory.
+        """
+        project_entries = []
+        log_stats = {}
+        with os.scandir(self.project_dir) as entries:
+            for entry in entries:
+                entry_name = entry.name
+                try:
+                    if entry_name.endswith(".json"):
+                        if entry.is_file():
+                            project_entries.append((entry, entry.stat()))
+                    elif entry_name.endswith(_LOG_SUFFIX):
+                        stat = entry.stat()
+                        log_stats.setdefault(entry_name[:-len(_LOG_SUFFIX)], []).append(
+                            (entry_name, stat.st_mtime_ns, stat.st_size)
+                        )
+                    elif entry_name.endswith(_FOLDING_SUFFIX):
+                        match = _FOLDING_PATTERN.fullmatch(entry_name)
+                        if match is not None:
+                            stat = entry.stat()
+                            log_stats.setdefault(match.group(1), []).append(
+                                (entry_name, stat.st_mtime_ns, stat.st_size)
+                            )
+                except FileNotFoundError:
+                    continue
+        
         projects = []
-        for file_path in self.project_dir.glob("*.json"):
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                projects.append({
-                    "name": data.get("name", "Unknown"),
-                    "description": data.get("description"),
-                    "location": data.get("location"),
-                    "created_at": data.get("created_at"),
-                    "material_count": len(data.get("materials", []))
-                })
-            except (json.JSONDecodeError, FileNotFoundError):
-                continue
+        summaries = {}
+        for entry, stat in project_entries:
+            # Appended materials change the count without touching the project file
+            logs = log_stats.get(entry.name[:-len(".json")])
+            key = (stat.st_mtime_ns, stat.st_size)
+            if logs is not None:
+                key += tuple(sorted(logs))
+            
+            cached = self._summary_cache.get(entry.path)
+            if cached is not None and cached[0] == key:
+                summary = cached[1]
+            elif logs is None:
+                summary = _read_summary(Path(entry.path), stat.st_mtime_ns)
+                if summary is None:
+                    continue
+            else:
+                newest = max(stat.st_mtime_ns, max(log[1] for log in logs))
+                summary = _read_meta(Path(entry.path), newest)
+                if summary is None:
+                    # Only a full load knows which logged materials are
+                    # duplicates or already folded
+                    project = self._load(Path(entry.path), tidy=False)
+                    if project is None:
+                        continue
+                    summary = _project_summary(project._to_record())
+            
+            summaries[entry.path] = (key, summary)
+            projects.append(dict(summary))
+        
+        # Keep only projects that still exist
+        self._summary_cache = summaries
         
         # Sort by created date, newest first
         return sorted(projects, key=lambda p: p.get("created_at", ""), reverse=True)
     
     def delete_project(self, name: str) -> bool:
         """Delete project from storage."""
-        file_path = self.project_dir / f"{name.replace(' ', '_')}.json"
+        file_path = self._project_path(name)
         if file_path.exists():
             file_path.unlink()
+            file_path.with_suffix(".meta").unlink(missing_ok=True)
+            _discard_logs(file_path)
             return True
         return False
+    
+    def _project_path(self, name: str) -> Path:
+        """Return the project file path for a project name."""
+        return self.project_dir / f"{name.replace(' ', '_')}.json"
+    
+    def _load(self, file_path: Path, tidy: bool = True) -> Optional[Project]:
+        """Load a project file and replay its pending appended materials.
+        
+        Args:
+            file_path: Project file
+            tidy: Remove logs a crashed save already folded into the file
+        """
+        if not file_path.exists():
+            return None
+        
+        try:
+            data = _loads(file_path.read_bytes())
+            project = Project.from_dict(data)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return None
+        
+        folded = data.get("folded_logs", ())
+        for generation, folding_path in _folding_logs(file_path):
+            if generation in folded:
+                # Left behind by a save that stopped before removing it
+                if tidy:
+                    folding_path.unlink(missing_ok=True)
+            else:
+                _replay_log(project, folding_path)
+        _replay_log(project, _log_path(file_path))
+        return project
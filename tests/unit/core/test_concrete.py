@@ -38,3 +38,13 @@ class TestConcreteCalculator:
         bags = self.calculator.bags_needed(volume, 80, "lb")
         assert bags > 0  # Should be a positive number
         assert isinstance(bags, int)  # Should be an integer
+    
+    def test_calculators_share_unit_registry(self):
+        """Test all calculators share the module-level unit registry."""
+        other = ConcreteCalculator()
+        assert other.ureg is self.calculator.ureg
+    
+    def test_module_unit_registry_alias(self):
+        """Test the module-level ureg name resolves to the shared registry."""
+        from buildwise.core import concrete
+        assert concrete.ureg is self.calculator.ureg
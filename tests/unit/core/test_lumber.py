@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 import pytest
 from buildwise.core.lumber import LumberCalculator, LumberType, LumberGrade
 
@@ -73,3 +75,67 @@ class TestLumberCalculator:
         assert "total_with_waste" in result
         assert result["total_with_waste"] > result["total_board_feet"]
         assert len(result["pieces"]) == 2
+    
+    def test_calculate_project_matches_board_feet(self):
+        """Test project pieces match per-piece board feet calculations."""
+        dimensions = [(4, 2, 8, 10), (5, 2, Decimal("7.5"), 3), (12, 8, 16.25, 2)]
+        result = self.calculator.calculate_project(dimensions=dimensions)
+        
+        expected = [self.calculator.calculate_board_feet(*d)["board_feet"] for d in dimensions]
+        assert [p["board_feet"] for p in result["pieces"]] == expected
+        assert result["total_board_feet"] == sum(expected)
+    
+    def test_calculate_project_cost_rounded_to_cents(self):
+        """Test project cost is rounded to whole cents."""
+        result = self.calculator.calculate_project(
+            dimensions=[(4, 2, 8, 3)],
+            lumber_type=LumberType.OAK,
+            grade=LumberGrade.TWO,
+            waste_factor=0.15
+        )
+        expected = result["total_with_waste"] * 7.5
+        assert result["cost"] == pytest.approx(expected, abs=0.005)
+        assert result["cost"] * 100 == pytest.approx(round(result["cost"] * 100))
+    
+    def test_calculate_project_cost_rounds_credits(self):
+        """Test negative project costs round to cents symmetrically with positive ones."""
+        from buildwise.core.lumber import _round_cents
+        
+        assert _round_cents(-0.006) == -0.01
+        assert _round_cents(-0.004) == 0.0
+        assert _round_cents(-1.235) == -_round_cents(1.235)
+    
+    def test_lookup_tables_shared_and_read_only(self):
+        """Test lookup tables are built once and cannot be mutated."""
+        other = LumberCalculator()
+        assert other.price_table is self.calculator.price_table
+        assert other.dimension_map is self.calculator.dimension_map
+        with pytest.raises(TypeError):
+            self.calculator.price_table[LumberType.PINE][LumberGrade.TWO] = 0
+    
+    def test_calculate_cost_accepts_strings(self):
+        """Test lumber type and grade strings are normalized to enums."""
+        by_enum = self.calculator.calculate_cost(10, LumberType.OAK, LumberGrade.SELECT)
+        by_string = self.calculator.calculate_cost(10, "Oak", "SELECT")
+        assert by_string == by_enum
+        assert self.calculator.calculate_cost(10, "unknown", "unknown") == 30.0
+    
+    def test_calculate_board_feet_decimal_length(self):
+        """Test Decimal lengths are accepted by the float path."""
+        result = self.calculator.calculate_board_feet(
+            nominal_width=4,
+            nominal_thickness=2,
+            length=Decimal("8")
+        )
+        assert result["board_feet"] == pytest.approx(3.5, 0.01)
+    
+    def test_calculate_board_feet_decimal(self):
+        """Test exact Decimal board feet calculation."""
+        result = self.calculator.calculate_board_feet_decimal(
+            nominal_width=6,
+            nominal_thickness=2,
+            length=Decimal("10.5"),
+            quantity=3
+        )
+        assert result["board_feet"] == Decimal("21.65625")
+        assert isinstance(result["volume"]["cubic_feet"], Decimal)
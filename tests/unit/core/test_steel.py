@@ -1,5 +1,9 @@
+from decimal import Decimal
+
 import pytest
-from buildwise.core.steel import SteelCalculator, SteelType, SteelGrade
+from buildwise.core.steel import (
+    SteelCalculator, SteelType, SteelGrade, WeightResult, format_weight_result
+)
 
 class TestSteelCalculator:
     """Test suite for SteelCalculator."""
@@ -53,3 +57,141 @@ class TestSteelCalculator:
         assert props["bar_number"] == 5
         assert props["diameter_inches"] == pytest.approx(0.625, 0.01)
         assert props["weight_per_foot"] == pytest.approx(1.043, 0.01)
+    
+    def test_calculate_weight_unit_conversion(self):
+        """Test length and weight unit conversion."""
+        feet = self.calculator.calculate_weight(
+            steel_type=SteelType.REBAR,
+            dimensions={"bar_number": 4},
+            length=10,
+        )
+        inches = self.calculator.calculate_weight(
+            steel_type=SteelType.REBAR,
+            dimensions={"bar_number": 4},
+            length=120,
+            length_unit="inches",
+            weight_unit="kg"
+        )
+        assert inches["weight_pounds"] == pytest.approx(feet["weight_pounds"], 0.01)
+        assert inches["weight_unit"] == "kilograms"
+        assert inches["weight"] == pytest.approx(feet["weight_pounds"] * 0.453592, 0.01)
+    
+    def test_string_type_and_grade_aliases(self):
+        """Test steel type and grade strings resolve to enum members."""
+        result = self.calculator.calculate_weight(
+            steel_type="Round Bar",
+            dimensions={"diameter": 1},
+            length=10
+        )
+        assert result["steel_type"] is SteelType.ROUND_BAR
+        assert result["weight_pounds"] > 0
+        
+        cost = self.calculator.calculate_cost(100, "REBAR", "Grade 60")
+        assert cost == pytest.approx(85.0)
+    
+    def test_get_rebar_properties_precomputed(self):
+        """Test standard rebar properties are prebuilt and read-only."""
+        props = self.calculator.get_rebar_properties(4)
+        assert self.calculator.get_rebar_properties(4) is props
+        with pytest.raises(TypeError):
+            props["weight_per_foot"] = 0
+        
+        unknown = self.calculator.get_rebar_properties(12)
+        assert unknown["weight_per_foot"] == 0
+        assert unknown["diameter_inches"] == pytest.approx(1.5)
+    
+    def test_calculate_batch(self):
+        """Test batch weights match individual calculations."""
+        items = [
+            (SteelType.REBAR, {"bar_number": 4}, 10, 2),
+            ("angle", {"width": 3, "height": 3, "thickness": 0.25}, 20, 1),
+        ]
+        weights = self.calculator.calculate_batch(items, weight_unit="kg")
+        for (steel_type, dimensions, length, quantity), weight in zip(items, weights):
+            single = self.calculator.calculate_weight(
+                steel_type, dimensions, length, quantity, weight_unit="kg"
+            )
+            assert weight == pytest.approx(single["weight"], abs=0.01)
+    
+    def test_price_table_shared_and_read_only(self):
+        """Test the price table is shared and cannot be mutated."""
+        assert SteelCalculator().price_table is self.calculator.price_table
+        with pytest.raises(TypeError):
+            self.calculator.price_table[SteelType.REBAR][SteelGrade.GRADE_60] = 0
+    
+    def test_calculate_weight_return_raw(self):
+        """Test raw weight results are WeightResult objects matching the dict."""
+        raw = self.calculator.calculate_weight(
+            steel_type=SteelType.ROUND_BAR,
+            dimensions={"diameter": 0.75},
+            length=7,
+            quantity=3,
+            return_raw=True
+        )
+        assert isinstance(raw, WeightResult)
+        result = self.calculator.calculate_weight(
+            steel_type=SteelType.ROUND_BAR,
+            dimensions={"diameter": 0.75},
+            length=7,
+            quantity=3
+        )
+        assert raw.weight_pounds == result["weight_pounds"]
+        assert raw.to_dict() == result
+        assert self.calculator.calculate_cost_cents(raw, SteelType.ROUND_BAR, SteelGrade.A36) == \
+            self.calculator.calculate_cost_cents(result, SteelType.ROUND_BAR, SteelGrade.A36)
+    
+    def test_format_weight_result(self):
+        """Test weights are unrounded until formatted for display."""
+        result = self.calculator.calculate_weight(
+            steel_type=SteelType.ROUND_BAR,
+            dimensions={"diameter": 0.75},
+            length=7,
+            quantity=3
+        )
+        formatted = format_weight_result(result)
+        assert formatted["weight_pounds"] == round(result["weight_pounds"], 2)
+        assert formatted["weight_pounds"] != result["weight_pounds"]
+        assert formatted["area_sq_inches"] == 0.44
+        assert formatted["weight_unit"] == result["weight_unit"]
+    
+    def test_calculate_cost_cents(self):
+        """Test cost in cents is an exact integer matching calculate_cost."""
+        cents = self.calculator.calculate_cost_cents(
+            weight=12.34,
+            steel_type=SteelType.REBAR,
+            grade=SteelGrade.GRADE_40
+        )
+        assert cents == 926
+        assert self.calculator.calculate_cost(12.34, SteelType.REBAR, SteelGrade.GRADE_40) == 9.26
+        assert self.calculator.calculate_cost_cents(10, "plate", "a36", price_per_pound=1.255) == 1255
+    
+    def test_calculator_has_no_instance_dict(self):
+        """Test the calculator is slotted with no per-instance state."""
+        assert not hasattr(self.calculator, "__dict__")
+    
+    def test_calculate_weight_scalar(self):
+        """Test scalar weight matches the unrounded weight from calculate_weight."""
+        dimensions = {"diameter": 1.25}
+        raw = self.calculator.calculate_weight(
+            SteelType.ROUND_BAR, dimensions, 3, quantity=2, length_unit="meters", return_raw=True
+        )
+        scalar = self.calculator.calculate_weight_scalar(
+            "round bar", dimensions, 3, quantity=2, length_unit="meters"
+        )
+        assert scalar == raw.weight_pounds
+    
+    def test_decimal_inputs(self):
+        """Test Decimal lengths and dimensions give the same weight as floats."""
+        for steel_type, dimensions in [
+            (SteelType.REBAR, {"bar_number": 5}),
+            (SteelType.ANGLE, {"width": Decimal("3"), "height": Decimal("2.5"), "thickness": Decimal("0.25")}),
+            (SteelType.ROUND_BAR, {"diameter": Decimal("1.25")}),
+        ]:
+            floats = {k: float(v) for k, v in dimensions.items()}
+            expected = self.calculator.calculate_weight_scalar(steel_type, floats, 12.5, length_unit="inches")
+            assert self.calculator.calculate_weight_scalar(
+                steel_type, dimensions, Decimal("12.5"), length_unit="inches"
+            ) == expected
+            assert self.calculator.calculate_batch(
+                [(steel_type, dimensions, Decimal("12.5"), 1)], length_unit="inches"
+            ) == pytest.approx([expected])
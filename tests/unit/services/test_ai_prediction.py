@@ -0,0 +1,88 @@
+import tempfile
+
+import pytest
+from buildwise.config.settings import Settings
+from buildwise.services import ai_prediction
+from buildwise.services.ai_prediction import AIPredictionService
+
+class TestAIPredictionService:
+    """Test suite for AIPredictionService fallback predictions."""
+    
+    def setup_method(self):
+        """Set up a service backed by settings under a temporary HOME."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.monkeypatch = pytest.MonkeyPatch()
+        self.monkeypatch.setenv("HOME", self.tmp_dir.name)
+        self.settings = Settings()
+        self.monkeypatch.setattr(ai_prediction, "settings", self.settings)
+        self.service = AIPredictionService()
+    
+    def teardown_method(self):
+        """Restore settings and clean up the temporary HOME."""
+        self.monkeypatch.undo()
+        self.tmp_dir.cleanup()
+    
+    def test_batch_matches_single_predictions(self):
+        """Test batch predictions equal one-at-a-time predictions."""
+        items = [
+            ("concrete", 4.5, "cubic_yards", "Texas"),
+            ("lumber", 120, "board_feet", "Austin, Texas"),
+            ("steel", 800, "pounds", " NEW YORK "),
+            ("lumber", 30, "board_feet", "Austin, Texas"),
+            ("gravel", 3, "tons", "Mars"),
+        ]
+        material_types, values, units, locations = zip(*items)
+        
+        batch = self.service.predict_material_cost_batch(material_types, values, units, locations)
+        single = [
+            self.service.predict_material_cost(material_type, {unit: value}, location)
+            for material_type, value, unit, location in items
+        ]
+        assert batch == single
+    
+    def test_batch_uses_model_when_available(self):
+        """Test batch predictions go through the model path when one is loaded."""
+        self.service.model = {"type": "dummy_model"}
+        
+        batch = self.service.predict_material_cost_batch(["steel"], [800], ["pounds"], ["Texas"])
+        assert batch == [self.service.predict_material_cost("steel", {"pounds": 800}, "Texas")]
+        assert batch[0]["source"] == "ai_model"
+    
+    def test_batch_rejects_bad_input(self):
+        """Test batch predictions reject mismatched lists and respect disabled fallback."""
+        with pytest.raises(ValueError):
+            self.service.predict_material_cost_batch(["steel", "lumber"], [800], ["pounds"], ["Texas"])
+        
+        self.service.fallback_enabled = False
+        with pytest.raises(ValueError):
+            self.service.predict_material_cost_batch(["steel"], [800], ["pounds"], ["Texas"])
+    
+    def test_price_update_invalidates_memoized_costs(self):
+        """Test settings price changes reach predictions made after them."""
+        assert self.service.predict_material_cost("steel", {"pounds": 100})["estimated_cost"] == pytest.approx(85)
+        version = self.settings.prices_version
+        
+        self.settings.update_material_price("steel_per_pound", 1.0)
+        assert self.settings.prices_version == version + 1
+        assert self.service.predict_material_cost("steel", {"pounds": 100})["estimated_cost"] == pytest.approx(100)
+        batch = self.service.predict_material_cost_batch(["steel"], [100], ["pounds"], ["United States"])
+        assert batch[0]["estimated_cost"] == pytest.approx(100)
+    
+    def test_location_normalization(self):
+        """Test free-form, padded, unknown and missing locations resolve to the right factors."""
+        def cost(location):
+            return self.service.predict_material_cost("concrete", {"cubic_yards": 2}, location)["estimated_cost"]
+        
+        assert cost("Austin, Texas") == pytest.approx(300 * 0.9)
+        assert cost(" NEW YORK ") == pytest.approx(300 * 1.2)
+        assert cost("Mars") == pytest.approx(300)
+        assert cost(None) == pytest.approx(300)
+    
+    def test_labor_and_timeline_fallbacks(self):
+        """Test labor cost and timeline fallbacks apply rates, stories and location."""
+        scope = {"area": 2000, "stories": 2}
+        
+        labor = self.service.predict_labor_cost("Commercial", scope, "Illinois")
+        assert labor["estimated_cost"] == pytest.approx(2000 * 45 * 1.1 * 1.1)
+        timeline = self.service.predict_project_timeline("residential", scope)
+        assert timeline["estimated_days"] == int(2 * 15 * 1.2)
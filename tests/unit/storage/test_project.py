@@ -0,0 +1,261 @@
+import json
+import os
+import stat
+import tempfile
+import threading
+
+from buildwise.storage.project import ProjectStorage, ProjectMaterial
+
+class TestProjectStorage:
+    """Test suite for ProjectStorage."""
+    
+    def setup_method(self):
+        """Set up test environment before each test."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = ProjectStorage(project_dir=self.tmp_dir.name)
+    
+    def teardown_method(self):
+        """Clean up the project directory after each test."""
+        self.tmp_dir.cleanup()
+    
+    def test_save_and_load_project(self):
+        """Test a saved project round-trips with its materials."""
+        project = self.storage.create_project("Deck Build", location="Texas")
+        project.add_material(ProjectMaterial("lumber", "Joists", 12, "board_feet", cost=36.0))
+        self.storage.save_project(project)
+        
+        loaded = self.storage.load_project("Deck Build")
+        assert loaded.id == project.id
+        assert loaded.location == "Texas"
+        assert [m.to_dict() for m in loaded.materials] == [m.to_dict() for m in project.materials]
+    
+    def test_save_project_is_atomic(self):
+        """Test saving leaves no temporary files and writes compact JSON by default."""
+        project = self.storage.create_project("Garage")
+        file_path = self.storage.project_dir / "Garage.json"
+        
+        assert sorted(p.name for p in self.storage.project_dir.iterdir()) == ["Garage.json", "Garage.meta"]
+        assert "\n" not in file_path.read_text()
+        
+        self.storage.save_project(project, pretty=True)
+        assert json.loads(file_path.read_text())["name"] == "Garage"
+        assert "\n" in file_path.read_text()
+    
+    def test_save_keeps_file_modes(self):
+        """Test saves create files with the umask default and keep an existing file's mode."""
+        umask = os.umask(0)
+        os.umask(umask)
+        project = self.storage.create_project("Studio")
+        file_path = self.storage.project_dir / "Studio.json"
+        assert stat.S_IMODE(file_path.stat().st_mode) == 0o666 & ~umask
+        
+        file_path.chmod(0o640)
+        self.storage.save_project(project)
+        assert stat.S_IMODE(file_path.stat().st_mode) == 0o640
+    
+    def test_concurrent_saves_use_separate_temp_files(self):
+        """Test saving one project from several threads never collides on a temp file."""
+        project = self.storage.create_project("Workshop")
+        errors = []
+        
+        def save():
+            try:
+                for _ in range(25):
+                    self.storage.save_project(project)
+            except OSError as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=save) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert errors == []
+        assert sorted(p.name for p in self.storage.project_dir.iterdir()) == ["Workshop.json", "Workshop.meta"]
+    
+    def test_list_projects_uses_metadata_sidecar(self):
+        """Test listing reads summaries from sidecars and falls back without them."""
+        project = self.storage.create_project("Patio", location="Florida")
+        project.add_material(ProjectMaterial("concrete", "Slab", 4, "cubic_yards"))
+        self.storage.save_project(project)
+        self.storage.create_project("Fence")
+        (self.storage.project_dir / "Fence.meta").unlink()
+        
+        projects = {p["name"]: p for p in self.storage.list_projects()}
+        assert projects["Patio"]["material_count"] == 1
+        assert projects["Patio"]["location"] == "Florida"
+        assert projects["Fence"]["material_count"] == 0
+        
+        assert self.storage.delete_project("Patio")
+        assert not (self.storage.project_dir / "Patio.meta").exists()
+    
+    def test_list_projects_cache_tracks_changes(self):
+        """Test cached summaries are refreshed after saves and dropped after deletes."""
+        project = self.storage.create_project("Kitchen")
+        assert self.storage.list_projects()[0]["material_count"] == 0
+        
+        project.add_material(ProjectMaterial("lumber", "Cabinets", 20, "board_feet"))
+        self.storage.save_project(project)
+        self.storage.list_projects()[0]["material_count"] = 99
+        assert self.storage.list_projects()[0]["material_count"] == 1
+        
+        self.storage.delete_project("Kitchen")
+        assert self.storage.list_projects() == []
+    
+    def test_add_materials(self):
+        """Test bulk-adding materials keeps order and updates the timestamp."""
+        project = self.storage.create_project("Framing")
+        project.updated_at = ""
+        materials = [ProjectMaterial("lumber", f"Stud {i}", 1, "board_feet") for i in range(3)]
+        
+        project.add_materials(materials)
+        assert [m.name for m in project.materials] == ["Stud 0", "Stud 1", "Stud 2"]
+        assert project.updated_at >= project.created_at
+    
+    def test_remove_materials(self):
+        """Test single and bulk material removal by id."""
+        project = self.storage.create_project("Roof")
+        materials = [ProjectMaterial("lumber", f"Rafter {i}", 1, "board_feet") for i in range(5)]
+        project.add_materials(materials)
+        self.storage.save_project(project)
+        project = self.storage.load_project("Roof")
+        
+        assert project.remove_material(materials[1].id)
+        assert not project.remove_material(materials[1].id)
+        assert project.remove_materials([materials[0].id, materials[3].id, "missing"]) == 2
+        assert [m.name for m in project.materials] == ["Rafter 2", "Rafter 4"]
+    
+    def test_models_have_no_instance_dict(self):
+        """Test projects and materials are slotted."""
+        project = self.storage.create_project("Barn")
+        assert not hasattr(project, "__dict__")
+        assert not hasattr(ProjectMaterial("steel", "Beam", 2, "pounds"), "__dict__")
+    
+    def test_folded_log_is_not_replayed_after_crash(self, monkeypatch):
+        """Test a removed material stays removed when a folded log is left behind."""
+        from pathlib import Path
+        
+        self.storage.create_project("Cellar")
+        posts = ProjectMaterial("lumber", "Posts", 4, "board_feet")
+        self.storage.append_material("Cellar", posts)
+        project = self.storage.load_project("Cellar")
+        assert project.remove_material(posts.id)
+        
+        # Crash after the project file is written but before the folded log is removed
+        unlink = Path.unlink
+        monkeypatch.setattr(Path, "unlink", lambda path, missing_ok=False: None)
+        self.storage.save_project(project)
+        monkeypatch.setattr(Path, "unlink", unlink)
+        assert any(p.suffix == ".folding" for p in self.storage.project_dir.iterdir())
+        
+        # Listing reports the folded state but leaves the files alone
+        before = sorted(p.name for p in self.storage.project_dir.iterdir())
+        assert self.storage.list_projects()[0]["material_count"] == 0
+        assert sorted(p.name for p in self.storage.project_dir.iterdir()) == before
+        
+        assert self.storage.load_project("Cellar").materials == []
+        assert sorted(p.name for p in self.storage.project_dir.iterdir()) == ["Cellar.json", "Cellar.meta"]
+    
+    def test_list_projects_counts_appends_from_metadata(self, monkeypatch):
+        """Test listing uses the sidecar append_material keeps current, without loading."""
+        self.storage.create_project("Shed")
+        self.storage.create_project("Barn")
+        for _ in range(3):
+            self.storage.append_material("Shed", ProjectMaterial("lumber", "Studs", 8, "board_feet"))
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("project loaded while listing")
+        monkeypatch.setattr(self.storage, "_load", fail)
+        counts = {p["name"]: p["material_count"] for p in self.storage.list_projects()}
+        assert counts == {"Shed": 3, "Barn": 0}
+    
+    def test_append_material_compacts_large_logs(self, monkeypatch):
+        """Test the materials log is folded in once it reaches the size threshold."""
+        from buildwise.storage import project as project_module
+        
+        monkeypatch.setattr(project_module, "_COMPACT_LOG_BYTES", 512)
+        self.storage.create_project("Garage")
+        log_path = self.storage.project_dir / "Garage.materials.jsonl"
+        for _ in range(5):
+            assert self.storage.append_material("Garage", ProjectMaterial("lumber", "Rafters", 6, "board_feet"))
+            assert not log_path.exists() or log_path.stat().st_size < 512
+        assert len(self.storage.load_project("Garage").materials) == 5
+        assert self.storage.list_projects()[0]["material_count"] == 5
+    
+    def test_create_project_discards_stale_log(self):
+        """Test a recreated project does not pick up an earlier project's appends."""
+        self.storage.create_project("Patio")
+        self.storage.append_material("Patio", ProjectMaterial("concrete", "Slab", 2, "cubic_yards"))
+        # Log left behind by an append that raced with the deletion
+        stale = (self.storage.project_dir / "Patio.materials.jsonl").read_bytes()
+        assert self.storage.delete_project("Patio")
+        (self.storage.project_dir / "Patio.materials.jsonl").write_bytes(stale)
+        
+        self.storage.create_project("Patio")
+        assert self.storage.load_project("Patio").materials == []
+        assert self.storage.list_projects()[0]["material_count"] == 0
+    
+    def test_save_keeps_materials_appended_after_load(self):
+        """Test saving a loaded project folds in appends made since it was loaded."""
+        self.storage.create_project("Loft")
+        self.storage.append_material("Loft", ProjectMaterial("lumber", "Joists", 10, "board_feet"))
+        project = self.storage.load_project("Loft")
+        self.storage.append_material("Loft", ProjectMaterial("lumber", "Rafters", 6, "board_feet"))
+        
+        project.remove_material(project.materials[0].id)
+        self.storage.save_project(project)
+        assert [m.name for m in self.storage.load_project("Loft").materials] == ["Rafters"]
+        assert sorted(p.name for p in self.storage.project_dir.iterdir()) == ["Loft.json", "Loft.meta"]
+    
+    def test_load_keeps_stored_ids_without_generating(self, monkeypatch):
+        """Test loading passes stored ids and timestamps straight to the models."""
+        from buildwise.storage import project as project_module
+        
+        project = self.storage.create_project("Attic")
+        project.add_material(ProjectMaterial("lumber", "Decking", 30, "board_feet"))
+        self.storage.save_project(project)
+        
+        def fail():
+            raise AssertionError("uuid4 called while loading")
+        monkeypatch.setattr(project_module.uuid, "uuid4", fail)
+        loaded = self.storage.load_project("Attic")
+        assert loaded.to_dict() == project.to_dict()
+    
+    def test_stdlib_json_fallback(self, monkeypatch):
+        """Test projects round-trip without orjson installed."""
+        from buildwise.storage import project as project_module
+        
+        monkeypatch.setattr(project_module, "orjson", None)
+        project = self.storage.create_project("Shed", description="Backyard")
+        
+        loaded = self.storage.load_project("Shed")
+        assert loaded.to_dict() == project.to_dict()
+    
+    def test_append_material_uses_log(self):
+        """Test appended materials are replayed on load and folded in on save."""
+        self.storage.create_project("Porch")
+        file_path = self.storage.project_dir / "Porch.json"
+        log_path = self.storage.project_dir / "Porch.materials.jsonl"
+        saved = file_path.read_bytes()
+        
+        assert self.storage.append_material("Porch", ProjectMaterial("lumber", "Posts", 4, "board_feet"))
+        assert self.storage.append_material("Porch", ProjectMaterial("concrete", "Footings", 1, "cubic_yards"))
+        assert not self.storage.append_material("Missing", ProjectMaterial("steel", "Beam", 2, "pounds"))
+        assert file_path.read_bytes() == saved
+        assert self.storage.list_projects()[0]["material_count"] == 2
+        
+        # A torn append from a crash is skipped
+        with open(log_path, "ab") as f:
+            f.write(b'{"id": "torn", "mater')
+        project = self.storage.load_project("Porch")
+        assert [m.name for m in project.materials] == ["Posts", "Footings"]
+        
+        assert self.storage.compact_project("Porch")
+        assert not log_path.exists()
+        assert [m.name for m in self.storage.load_project("Porch").materials] == ["Posts", "Footings"]
+        assert self.storage.list_projects()[0]["material_count"] == 2
+        
+        self.storage.append_material("Porch", ProjectMaterial("lumber", "Rails", 8, "board_feet"))
+        assert self.storage.delete_project("Porch")
+        assert list(self.storage.project_dir.iterdir()) == []